@@ -9,16 +9,151 @@ Author: João Pedro Cunha
 import sys
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+src_path = str(Path(__file__).parent.parent.parent / "src")
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
 
 import streamlit as st
+import pandas as pd
+import gzip
 import logging
-from io import StringIO
-
-from f1telemetry import report as report_module
+from functools import partial
+from io import BytesIO
 
 logger = logging.getLogger(__name__)
 
+# Rows serialized per to_csv call when building download payloads
+CSV_CHUNK_ROWS = 50_000
+
+# Rows shown in the raw telemetry preview
+PREVIEW_ROWS = 100
+
+# gzip level for compressed HTML reports (6 balances speed and ratio)
+REPORT_GZIP_LEVEL = 6
+
+# Telemetry columns preselected for export (raw channels plus physics channels)
+DEFAULT_TELEMETRY_COLUMNS = [
+    "Distance",
+    "Time",
+    "Speed",
+    "Throttle",
+    "Brake",
+    "nGear",
+    "RPM",
+    "DRS",
+    "Acceleration",
+    "X",
+    "Y",
+]
+
+# Telemetry download formats: display name -> (file extension, MIME type)
+TELEMETRY_FORMATS = {
+    "Parquet": ("parquet", "application/octet-stream"),
+    "Feather": ("feather", "application/octet-stream"),
+    "CSV": ("csv", "text/csv"),
+}
+
+
+def _flatten_for_csv(df: pd.DataFrame) -> pd.DataFrame:
+    """Move MultiIndex levels into columns; to_csv is very slow on MultiIndex frames."""
+    if isinstance(df.index, pd.MultiIndex):
+        return df.reset_index(drop=False)
+    return df
+
+
+def _to_csv_bytes(df: pd.DataFrame, chunksize: int = CSV_CHUNK_ROWS) -> bytes:
+    """Serialize a DataFrame to UTF-8 CSV bytes, one row chunk at a time.
+
+    Avoids holding a full StringIO buffer alongside its getvalue() copy.
+    """
+    df = _flatten_for_csv(df)
+    payload = bytearray()
+    for start in range(0, max(len(df), 1), chunksize):
+        chunk = df.iloc[start : start + chunksize]
+        payload += chunk.to_csv(index=False, header=start == 0).encode("utf-8")
+    return bytes(payload)
+
+
+# Download payload builders. These run on Streamlit's download thread when the
+# user clicks a button, so they must not touch st.session_state.
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _cached_csv_bytes(df: pd.DataFrame) -> bytes:
+    """CSV payload for a DataFrame, reused across repeated downloads."""
+    return _to_csv_bytes(df)
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _cached_telemetry_bytes(
+    telemetry: pd.DataFrame, telemetry_format: str, columns: tuple = ()
+) -> bytes:
+    """Serialize telemetry (optionally only some columns) in one of the TELEMETRY_FORMATS."""
+    if columns:
+        telemetry = telemetry[[col for col in columns if col in telemetry.columns]]
+
+    if telemetry_format == "CSV":
+        return _to_csv_bytes(telemetry)
+
+    buffer = BytesIO()
+    if telemetry_format == "Parquet":
+        telemetry.to_parquet(buffer, engine="pyarrow", compression="snappy", index=False)
+    else:
+        # Feather requires a default RangeIndex
+        telemetry.reset_index(drop=True).to_feather(buffer, compression="lz4")
+    return buffer.getvalue()
+
+
+def _html_report_payload(compress: bool = False, **report_kwargs) -> bytes:
+    """Render the HTML report for download, optionally gzip-compressed."""
+    try:
+        # Imported on first download so page reruns don't pay for plotly/jinja2
+        from f1telemetry import report as report_module
+
+        html_bytes = b"".join(report_module.stream_html_report(**report_kwargs))
+        if compress:
+            return gzip.compress(html_bytes, compresslevel=REPORT_GZIP_LEVEL)
+        return html_bytes
+    except Exception as e:
+        logger.error(f"HTML report generation error: {e}", exc_info=True)
+        raise
+
+
+@st.fragment
+def _render_data_preview(driver1_name: str, driver2_name: str):
+    """Render the data preview; selection changes rerun only this fragment."""
+    data_type = st.selectbox(
+        "Select data to preview",
+        options=[
+            "Minisector Deltas",
+            "Braking Zones",
+            "Corner Performance",
+            "Delta Decomposition",
+            f"{driver1_name} Telemetry",
+            f"{driver2_name} Telemetry",
+        ],
+    )
+
+    if data_type == "Minisector Deltas":
+        st.dataframe(st.session_state.minisector_data, use_container_width=True)
+    elif data_type == "Braking Zones":
+        if not st.session_state.braking_comparison.empty:
+            st.dataframe(st.session_state.braking_comparison, use_container_width=True)
+        else:
+            st.info("No braking zones data available")
+    elif data_type == "Corner Performance":
+        st.dataframe(st.session_state.corner_report_table, use_container_width=True)
+    elif data_type == "Delta Decomposition":
+        st.dataframe(st.session_state.decomp_table, use_container_width=True)
+    elif data_type in (f"{driver1_name} Telemetry", f"{driver2_name} Telemetry"):
+        telemetry = (
+            st.session_state.telemetry1
+            if data_type == f"{driver1_name} Telemetry"
+            else st.session_state.telemetry2
+        )
+        st.dataframe(telemetry.iloc[:PREVIEW_ROWS], use_container_width=True)
+        st.caption(f"Showing first {PREVIEW_ROWS} of {len(telemetry)} rows")
+
 
 def render():
     """Render the Exports page."""
@@ -34,41 +169,43 @@ def render():
     """
     )
 
+    driver1_name = st.session_state.driver1_name
+    driver2_name = st.session_state.driver2_name
+
     # HTML Report Section
     st.subheader("HTML Report")
     st.markdown("Generate a comprehensive HTML report with all analysis and visualizations.")
 
-    if st.button("Generate HTML Report", type="primary"):
-        try:
-            with st.spinner("Generating HTML report..."):
-                # Generate report with enhanced insights
-                html_content = report_module.generate_html_report(
-                    session_info=st.session_state.session_info,
-                    comparison_summary=st.session_state.comparison_summary,
-                    driver1_name=st.session_state.driver1_name,
-                    driver2_name=st.session_state.driver2_name,
-                    telemetry1=st.session_state.telemetry1,
-                    telemetry2=st.session_state.telemetry2,
-                    config=st.session_state.config,
-                    minisector_data=st.session_state.minisector_data,
-                    corners1=st.session_state.corners1,
-                    corners2=st.session_state.corners2,
-                    decompositions=st.session_state.decompositions,
-                )
-
-                # Provide download button
-                st.download_button(
-                    label="Download HTML Report",
-                    data=html_content,
-                    file_name=f"f1_telemetry_report_{st.session_state.driver1_name}_vs_{st.session_state.driver2_name}.html",
-                    mime="text/html",
-                )
-
-                st.success("HTML report generated successfully!")
-
-        except Exception as e:
-            st.error(f"Error generating HTML report: {str(e)}")
-            logger.error(f"HTML report generation error: {e}", exc_info=True)
+    compress_report = st.checkbox(
+        "Compress report (gzip)",
+        value=False,
+        key="exports_report_gzip",
+        help="Embedded plot data compresses well; the .html.gz opens after extraction",
+    )
+    report_file_name = f"f1_telemetry_report_{driver1_name}_vs_{driver2_name}.html"
+
+    # The report is only rendered when the download is actually requested
+    st.download_button(
+        label="Download HTML Report",
+        data=partial(
+            _html_report_payload,
+            compress=compress_report,
+            session_info=st.session_state.session_info,
+            comparison_summary=st.session_state.comparison_summary,
+            driver1_name=driver1_name,
+            driver2_name=driver2_name,
+            telemetry1=st.session_state.telemetry1,
+            telemetry2=st.session_state.telemetry2,
+            config=st.session_state.config,
+            minisector_data=st.session_state.minisector_data,
+            corners1=st.session_state.corners1,
+            corners2=st.session_state.corners2,
+            decompositions=st.session_state.decompositions,
+        ),
+        file_name=f"{report_file_name}.gz" if compress_report else report_file_name,
+        mime="application/gzip" if compress_report else "text/html",
+        type="primary",
+    )
 
     st.markdown("---")
 
@@ -81,96 +218,43 @@ def render():
     with col1:
         # Minisector deltas CSV
         st.markdown("**Minisector Deltas**")
-        if st.button("Export Minisector Data"):
-            try:
-                csv_buffer = StringIO()
-                st.session_state.minisector_data.to_csv(csv_buffer, index=False)
-                csv_data = csv_buffer.getvalue()
-
-                st.download_button(
-                    label="Download Minisector CSV",
-                    data=csv_data,
-                    file_name=f"minisector_deltas_{st.session_state.driver1_name}_vs_{st.session_state.driver2_name}.csv",
-                    mime="text/csv",
-                )
-                st.success("Minisector data ready for download!")
-            except Exception as e:
-                st.error(f"Error exporting minisector data: {str(e)}")
+        st.download_button(
+            label="Download Minisector CSV",
+            data=partial(_cached_csv_bytes, st.session_state.minisector_data),
+            file_name=f"minisector_deltas_{driver1_name}_vs_{driver2_name}.csv",
+            mime="text/csv",
+        )
 
         # Corner comparison CSV
         st.markdown("**Corner Performance**")
-        if st.button("Export Corner Data"):
-            try:
-                from f1telemetry import corners as corners_module
-
-                corner_table = corners_module.create_corner_report_table(
-                    st.session_state.corners1,
-                    st.session_state.corners2,
-                    st.session_state.driver1_name,
-                    st.session_state.driver2_name,
-                )
-
-                csv_buffer = StringIO()
-                corner_table.to_csv(csv_buffer, index=False)
-                csv_data = csv_buffer.getvalue()
-
-                st.download_button(
-                    label="Download Corner CSV",
-                    data=csv_data,
-                    file_name=f"corner_performance_{st.session_state.driver1_name}_vs_{st.session_state.driver2_name}.csv",
-                    mime="text/csv",
-                )
-                st.success("Corner data ready for download!")
-            except Exception as e:
-                st.error(f"Error exporting corner data: {str(e)}")
+        st.download_button(
+            label="Download Corner CSV",
+            data=partial(_cached_csv_bytes, st.session_state.corner_report_table),
+            file_name=f"corner_performance_{driver1_name}_vs_{driver2_name}.csv",
+            mime="text/csv",
+        )
 
     with col2:
         # Braking zones CSV
         st.markdown("**Braking Zones**")
-        if st.button("Export Braking Zones"):
-            try:
-                if not st.session_state.braking_comparison.empty:
-                    csv_buffer = StringIO()
-                    st.session_state.braking_comparison.to_csv(csv_buffer, index=False)
-                    csv_data = csv_buffer.getvalue()
-
-                    st.download_button(
-                        label="Download Braking Zones CSV",
-                        data=csv_data,
-                        file_name=f"braking_zones_{st.session_state.driver1_name}_vs_{st.session_state.driver2_name}.csv",
-                        mime="text/csv",
-                    )
-                    st.success("Braking zones data ready for download!")
-                else:
-                    st.warning("No braking zones data available")
-            except Exception as e:
-                st.error(f"Error exporting braking zones: {str(e)}")
+        if not st.session_state.braking_comparison.empty:
+            st.download_button(
+                label="Download Braking Zones CSV",
+                data=partial(_cached_csv_bytes, st.session_state.braking_comparison),
+                file_name=f"braking_zones_{driver1_name}_vs_{driver2_name}.csv",
+                mime="text/csv",
+            )
+        else:
+            st.warning("No braking zones data available")
 
         # Delta decomposition CSV
         st.markdown("**Delta Decomposition**")
-        if st.button("Export Delta Decomposition"):
-            try:
-                from f1telemetry import delta_decomp
-
-                decomp_table = delta_decomp.create_decomposition_table(
-                    st.session_state.decompositions,
-                    st.session_state.driver1_name,
-                    st.session_state.driver2_name,
-                )
-
-                csv_buffer = StringIO()
-                decomp_table.to_csv(csv_buffer, index=False)
-                csv_data = csv_buffer.getvalue()
-
-                st.download_button(
-                    label="Download Decomposition CSV",
-                    data=csv_data,
-                    file_name=f"delta_decomposition_{st.session_state.driver1_name}_vs_{st.session_state.driver2_name}.csv",
-                    mime="text/csv",
-                )
-                st.success("Delta decomposition data ready for download!")
-            except Exception as e:
-                st.error(f"Error exporting delta decomposition: {str(e)}")
+        st.download_button(
+            label="Download Decomposition CSV",
+            data=partial(_cached_csv_bytes, st.session_state.decomp_table),
+            file_name=f"delta_decomposition_{driver1_name}_vs_{driver2_name}.csv",
+            mime="text/csv",
+        )
 
     st.markdown("---")
 
@@ -178,43 +262,58 @@ def render():
     st.subheader("Raw Telemetry Data")
     st.markdown("Download raw telemetry data with physics channels.")
 
+    telemetry_format = st.radio(
+        "Format",
+        options=list(TELEMETRY_FORMATS.keys()),
+        horizontal=True,
+        key="exports_telemetry_format",
+        help="Parquet and Feather are much smaller and faster to write than CSV",
+    )
+    extension, mime = TELEMETRY_FORMATS[telemetry_format]
+
+    telemetry_columns = list(st.session_state.telemetry1.columns)
+    telemetry_columns += [
+        col for col in st.session_state.telemetry2.columns if col not in telemetry_columns
+    ]
+    export_columns = tuple(
+        st.multiselect(
+            "Columns to export",
+            options=telemetry_columns,
+            default=[col for col in DEFAULT_TELEMETRY_COLUMNS if col in telemetry_columns],
+            key="exports_telemetry_columns",
+            help="Fewer columns mean smaller, faster exports. Leave empty to export all columns.",
+        )
+    )
+
     col1, col2 = st.columns(2)
 
     with col1:
-        st.markdown(f"**{st.session_state.driver1_name} Telemetry**")
-        if st.button(f"Export {st.session_state.driver1_name} Telemetry"):
-            try:
-                csv_buffer = StringIO()
-                st.session_state.telemetry1.to_csv(csv_buffer, index=False)
-                csv_data = csv_buffer.getvalue()
-
-                st.download_button(
-                    label=f"Download {st.session_state.driver1_name} Telemetry CSV",
-                    data=csv_data,
-                    file_name=f"telemetry_{st.session_state.driver1_name}.csv",
-                    mime="text/csv",
-                )
-                st.success("Telemetry data ready for download!")
-            except Exception as e:
-                st.error(f"Error exporting telemetry: {str(e)}")
+        st.markdown(f"**{driver1_name} Telemetry**")
+        st.download_button(
+            label=f"Download {driver1_name} Telemetry {telemetry_format}",
+            data=partial(
+                _cached_telemetry_bytes,
+                st.session_state.telemetry1,
+                telemetry_format,
+                export_columns,
+            ),
+            file_name=f"telemetry_{driver1_name}.{extension}",
+            mime=mime,
+        )
 
     with col2:
-        st.markdown(f"**{st.session_state.driver2_name} Telemetry**")
-        if st.button(f"Export {st.session_state.driver2_name} Telemetry"):
-            try:
-                csv_buffer = StringIO()
-                st.session_state.telemetry2.to_csv(csv_buffer, index=False)
-                csv_data = csv_buffer.getvalue()
-
-                st.download_button(
-                    label=f"Download {st.session_state.driver2_name} Telemetry CSV",
-                    data=csv_data,
-                    file_name=f"telemetry_{st.session_state.driver2_name}.csv",
-                    mime="text/csv",
-                )
-                st.success("Telemetry data ready for download!")
-            except Exception as e:
-                st.error(f"Error exporting telemetry: {str(e)}")
+        st.markdown(f"**{driver2_name} Telemetry**")
+        st.download_button(
+            label=f"Download {driver2_name} Telemetry {telemetry_format}",
+            data=partial(
+                _cached_telemetry_bytes,
+                st.session_state.telemetry2,
+                telemetry_format,
+                export_columns,
+            ),
+            file_name=f"telemetry_{driver2_name}.{extension}",
+            mime=mime,
+        )
 
     st.markdown("---")
 
@@ -222,47 +321,4 @@ def render():
     st.subheader("Data Preview")
     st.markdown("Preview available data before downloading.")
 
-    data_type = st.selectbox(
-        "Select data to preview",
-        options=[
-            "Minisector Deltas",
-            "Braking Zones",
-            "Corner Performance",
-            "Delta Decomposition",
-            f"{st.session_state.driver1_name} Telemetry",
-            f"{st.session_state.driver2_name} Telemetry",
-        ],
-    )
-
-    if data_type == "Minisector Deltas":
-        st.dataframe(st.session_state.minisector_data, use_container_width=True)
-    elif data_type == "Braking Zones":
-        if not st.session_state.braking_comparison.empty:
-            st.dataframe(st.session_state.braking_comparison, use_container_width=True)
-        else:
-            st.info("No braking zones data available")
-    elif data_type == "Corner Performance":
-        from f1telemetry import corners as corners_module
-
-        corner_table = corners_module.create_corner_report_table(
-            st.session_state.corners1,
-            st.session_state.corners2,
-            st.session_state.driver1_name,
-            st.session_state.driver2_name,
-        )
-        st.dataframe(corner_table, use_container_width=True)
-    elif data_type == "Delta Decomposition":
-        from f1telemetry import delta_decomp
-
-        decomp_table = delta_decomp.create_decomposition_table(
-            st.session_state.decompositions,
-            st.session_state.driver1_name,
-            st.session_state.driver2_name,
-        )
-        st.dataframe(decomp_table, use_container_width=True)
-    elif data_type == f"{st.session_state.driver1_name} Telemetry":
-        st.dataframe(st.session_state.telemetry1.head(100), use_container_width=True)
-        st.caption(f"Showing first 100 of {len(st.session_state.telemetry1)} rows")
-    elif data_type == f"{st.session_state.driver2_name} Telemetry":
-        st.dataframe(st.session_state.telemetry2.head(100), use_container_width=True)
-        st.caption(f"Showing first 100 of {len(st.session_state.telemetry2)} rows")
+    _render_data_preview(driver1_name, driver2_name)
@@ -9,7 +9,9 @@ Author: João Pedro Cunha
 import sys
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+src_path = str(Path(__file__).parent.parent.parent / "src")
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
 
 import streamlit as st
 import logging
@@ -23,6 +25,12 @@ from f1telemetry import (
 logger = logging.getLogger(__name__)
 
 
+@st.cache_resource(max_entries=8, show_spinner=False)
+def _load_session(year: int, event: str, session_type: str):
+    """Load a FastF1 session once and share it across reruns."""
+    return data_loader.load_session(year, event, session_type, cfg.Config())
+
+
 def render():
     """Render the Race Pace & Stints page."""
     st.header("Race Pace & Stint Analysis")
@@ -77,8 +85,7 @@ def render():
     if load_button:
         try:
             with st.spinner("Loading race session..."):
-                config = cfg.Config()
-                session = data_loader.load_session(year, event, session_type, config)
+                session = _load_session(year, event, session_type)
 
                 # Load laps for driver 1
                 driver1_laps = session.laps.pick_driver(driver1)
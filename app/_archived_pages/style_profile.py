@@ -9,7 +9,9 @@ Author: João Pedro Cunha
 import sys
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+src_path = str(Path(__file__).parent.parent.parent / "src")
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
 
 import streamlit as st
 import logging
@@ -24,6 +26,64 @@ from f1telemetry import (
 logger = logging.getLogger(__name__)
 
 
+@st.cache_resource(max_entries=8, show_spinner=False)
+def _load_session(year: int, event: str, session_type: str):
+    """Load a FastF1 session once and share it across reruns."""
+    return data_loader.load_session(year, event, session_type, cfg.Config())
+
+
+def _load_lap_telemetry(lap, config):
+    """Load telemetry with physics channels for one lap, or None on failure."""
+    try:
+        tel = data_loader.get_telemetry(lap)
+        # Add physics channels
+        return physics.add_physics_channels(tel, config)
+    except Exception as e:
+        logger.warning(f"Failed to load telemetry for lap {lap['LapNumber']}: {e}")
+        return None
+
+
+def _load_laps_telemetry(laps, config) -> list:
+    """Load telemetry for all laps in lap order, skipping laps that fail to load."""
+    # get_telemetry() needs FastF1 Lap rows; itertuples() would yield plain
+    # namedtuples without get_telemetry(), so keep iterrows() here. The laps share
+    # one FastF1 Session, so they are fetched one at a time.
+    telemetry_list = []
+    for _, lap in laps.iterrows():
+        tel = _load_lap_telemetry(lap, config)
+        if tel is not None:
+            telemetry_list.append(tel)
+    return telemetry_list
+
+
+def _fastest_valid_laps(laps, n: int):
+    """Select the n fastest accurate laps; laps without a LapTime (NaT) sort last."""
+    valid = laps[laps["IsAccurate"]] if "IsAccurate" in laps.columns else laps
+    return valid.sort_values("LapTime").head(n)
+
+
+def _format_style_kpis(stats: dict) -> list:
+    """Format KPI metrics into (label, value) pairs, two per display column."""
+    return [
+        [
+            ("Avg Speed", f"{stats.get('avg_speed', 0):.1f} km/h"),
+            ("Max Speed", f"{stats.get('max_speed', 0):.1f} km/h"),
+        ],
+        [
+            ("% Full Throttle", f"{stats.get('percent_full_throttle', 0):.1f}%"),
+            ("% Braking", f"{stats.get('percent_braking', 0):.1f}%"),
+        ],
+        [
+            ("Max Accel", f"{stats.get('max_accel', 0):.2f} g"),
+            ("Max Decel", f"{stats.get('max_decel', 0):.2f} g"),
+        ],
+        [
+            ("Avg Lat Accel", f"{stats.get('avg_lat_accel', 0):.2f} g"),
+            ("Max Lat Accel", f"{stats.get('max_lat_accel', 0):.2f} g"),
+        ],
+    ]
+
+
 def render():
     """Render the Driver Style Profile page."""
     st.header("Driver Style Profile")
@@ -76,7 +136,7 @@ def render():
         try:
             with st.spinner("Loading session and telemetry..."):
                 config = cfg.Config()
-                session = data_loader.load_session(year, event, session_type, config)
+                session = _load_session(year, event, session_type)
 
                 # Get driver 1 laps
                 driver1_laps = session.laps.pick_driver(driver1)
@@ -85,23 +145,10 @@ def render():
                     return
 
                 # Get fastest N valid laps
-                valid_laps1 = (
-                    driver1_laps[driver1_laps["IsAccurate"]]
-                    if "IsAccurate" in driver1_laps.columns
-                    else driver1_laps
-                )
-                valid_laps1 = valid_laps1.sort_values("LapTime").head(num_laps)
+                valid_laps1 = _fastest_valid_laps(driver1_laps, num_laps)
 
                 # Load telemetry for each lap
-                telemetry_list1 = []
-                for idx, lap in valid_laps1.iterrows():
-                    try:
-                        tel = data_loader.get_telemetry(lap)
-                        # Add physics channels
-                        tel = physics.add_physics_channels(tel, config)
-                        telemetry_list1.append(tel)
-                    except Exception as e:
-                        logger.warning(f"Failed to load telemetry for lap {lap['LapNumber']}: {e}")
+                telemetry_list1 = _load_laps_telemetry(valid_laps1, config)
 
                 if not telemetry_list1:
                     st.error("Failed to load any telemetry data")
@@ -115,28 +162,15 @@ def render():
                 st.session_state.style_loaded_driver1 = driver1
                 st.session_state.style_telemetry1 = telemetry_list1
                 st.session_state.style_stats1 = stats1
+                st.session_state.style_kpis1 = _format_style_kpis(stats1)
 
                 # Load driver 2 if compare mode
                 if compare_mode and driver2:
                     driver2_laps = session.laps.pick_driver(driver2)
                     if not driver2_laps.empty:
-                        valid_laps2 = (
-                            driver2_laps[driver2_laps["IsAccurate"]]
-                            if "IsAccurate" in driver2_laps.columns
-                            else driver2_laps
-                        )
-                        valid_laps2 = valid_laps2.sort_values("LapTime").head(num_laps)
-
-                        telemetry_list2 = []
-                        for idx, lap in valid_laps2.iterrows():
-                            try:
-                                tel = data_loader.get_telemetry(lap)
-                                tel = physics.add_physics_channels(tel, config)
-                                telemetry_list2.append(tel)
-                            except Exception as e:
-                                logger.warning(
-                                    f"Failed to load telemetry for lap {lap['LapNumber']}: {e}"
-                                )
+                        valid_laps2 = _fastest_valid_laps(driver2_laps, num_laps)
+
+                        telemetry_list2 = _load_laps_telemetry(valid_laps2, config)
 
                         if telemetry_list2:
                             stats2 = style_profile.aggregate_telemetry_stats(
@@ -169,25 +203,14 @@ def render():
     # KPI Cards
     st.subheader(f"Driver Style Metrics - {st.session_state.style_loaded_driver1}")
 
-    stats1 = st.session_state.style_stats1
-
-    col1, col2, col3, col4 = st.columns(4)
-
-    with col1:
-        st.metric("Avg Speed", f"{stats1.get('avg_speed', 0):.1f} km/h")
-        st.metric("Max Speed", f"{stats1.get('max_speed', 0):.1f} km/h")
-
-    with col2:
-        st.metric("% Full Throttle", f"{stats1.get('percent_full_throttle', 0):.1f}%")
-        st.metric("% Braking", f"{stats1.get('percent_braking', 0):.1f}%")
-
-    with col3:
-        st.metric("Max Accel", f"{stats1.get('max_accel', 0):.2f} g")
-        st.metric("Max Decel", f"{stats1.get('max_decel', 0):.2f} g")
+    # Formatted once at load time; reruns only replay the cached strings
+    if "style_kpis1" not in st.session_state:
+        st.session_state.style_kpis1 = _format_style_kpis(st.session_state.style_stats1)
 
-    with col4:
-        st.metric("Avg Lat Accel", f"{stats1.get('avg_lat_accel', 0):.2f} g")
-        st.metric("Max Lat Accel", f"{stats1.get('max_lat_accel', 0):.2f} g")
+    for col, metrics in zip(st.columns(4), st.session_state.style_kpis1):
+        with col:
+            for label, value in metrics:
+                st.metric(label, value)
 
     st.markdown("---")
 
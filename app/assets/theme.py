@@ -8,12 +8,17 @@ from pathlib import Path
 import streamlit as st
 
 
+@st.cache_data(show_spinner=False)
+def _read_css(path_str: str) -> str:
+    """Read a stylesheet once per process instead of on every rerun."""
+    return Path(path_str).read_text()
+
+
 def load_css():
     """Load custom CSS styles."""
     css_file = Path(__file__).parent / "styles.css"
     if css_file.exists():
-        with open(css_file) as f:
-            st.markdown(f"<style>{f.read()}</style>", unsafe_allow_html=True)
+        st.markdown(f"<style>{_read_css(str(css_file))}</style>", unsafe_allow_html=True)
 
 
 def set_page_config(title: str, icon: str = "🏎️", layout: str = "wide"):
@@ -49,10 +54,7 @@ def create_data_status_panel(session_info: dict):
     Args:
         session_info: Dictionary with session metadata
     """
-    st.markdown('<div class="data-status">', unsafe_allow_html=True)
-    st.markdown("<h4>Data Status</h4>", unsafe_allow_html=True)
-
-    for key, value in session_info.items():
-        st.markdown(f"<p><strong>{key}:</strong> {value}</p>", unsafe_allow_html=True)
-
-    st.markdown("</div>", unsafe_allow_html=True)
+    rows = "".join(f"<p><strong>{key}:</strong> {value}</p>" for key, value in session_info.items())
+    st.markdown(
+        f'<div class="data-status"><h4>Data Status</h4>{rows}</div>', unsafe_allow_html=True
+    )
@@ -8,7 +8,11 @@ from components.session_header import render_session_header
 from components.kpi_cards import render_kpi_cards
 from components.insight_summary import render_insight_summary
 from components.lap_selector import render_lap_selector, get_available_laps
-from components.event_selector import render_event_selector, get_season_schedule
+from components.event_selector import (
+    render_event_selector,
+    get_season_schedule,
+    get_season_event_options,
+)
 
 __all__ = [
     "render_session_header",
@@ -18,4 +22,5 @@ __all__ = [
     "get_available_laps",
     "render_event_selector",
     "get_season_schedule",
+    "get_season_event_options",
 ]
@@ -7,7 +7,7 @@ Author: João Pedro Cunha
 """
 
 import streamlit as st
-from typing import Tuple, Dict, Any
+from typing import Tuple, Dict, Any, List
 import pandas as pd
 import fastf1
 import logging
@@ -15,7 +15,12 @@ import logging
 logger = logging.getLogger(__name__)
 
 
-@st.cache_data(ttl=3600)  # Cache for 1 hour
+@st.cache_data(ttl=86400)  # Schedules rarely change; cache for 1 day
+def _fetch_season_schedule(year: int) -> pd.DataFrame:
+    """Fetch a season schedule; errors propagate so failed fetches are not cached."""
+    return fastf1.get_event_schedule(year)
+
+
 def get_season_schedule(year: int) -> pd.DataFrame:
     """
     Get season schedule from FastF1.
@@ -27,13 +32,71 @@ def get_season_schedule(year: int) -> pd.DataFrame:
         DataFrame with event schedule
     """
     try:
-        schedule = fastf1.get_event_schedule(year)
+        schedule = _fetch_season_schedule(year)
         return schedule
     except Exception as e:
         logger.error(f"Failed to load season schedule for {year}: {e}")
         return pd.DataFrame()
 
 
+@st.cache_data(ttl=86400)  # Same lifetime as the schedule it is built from
+def get_season_event_options(year: int) -> Tuple[List[str], Dict[str, Dict[str, Any]]]:
+    """
+    Build event dropdown labels and metadata for a season.
+
+    Args:
+        year: Season year
+
+    Returns:
+        Tuple of (event_options, event_map)
+        event_options: Labels in schedule order (empty if the schedule has no events)
+        event_map: Label -> event metadata dict
+
+    Raises:
+        Exception: If the schedule cannot be fetched (not cached, so the next call retries)
+    """
+    schedule = _fetch_season_schedule(year)
+
+    if schedule.empty:
+        return [], {}
+
+    # Create event options; missing optional columns are resolved once, not per row
+    num_events = len(schedule)
+    countries = schedule["Country"].tolist() if "Country" in schedule.columns else [""] * num_events
+    locations = schedule["Location"].tolist() if "Location" in schedule.columns else countries
+    dates = (
+        [str(date) for date in schedule["EventDate"]]
+        if "EventDate" in schedule.columns
+        else [""] * num_events
+    )
+
+    event_options = []
+    event_map = {}
+
+    for round_num, event_name, location, country, date in zip(
+        schedule["RoundNumber"].tolist(),
+        schedule["EventName"].tolist(),
+        locations,
+        countries,
+        dates,
+    ):
+        # Build label: "Round X - Event Name (Location)"
+        label = f"Round {round_num} - {event_name}"
+        if location and location != event_name:
+            label += f" ({location})"
+
+        event_options.append(label)
+        event_map[label] = {
+            "event_name": event_name,
+            "round": int(round_num),
+            "location": location,
+            "country": country,
+            "date": date,
+        }
+
+    return event_options, event_map
+
+
 def render_event_selector(
     year: int,
     key_prefix: str = "event",
@@ -50,10 +113,14 @@ def render_event_selector(
         event_identifier: Either event name or round number as string
         event_metadata: Dict with event information
     """
-    # Load season schedule
-    schedule = get_season_schedule(year)
+    # Load prebuilt event options for the season
+    try:
+        event_options, event_map = get_season_event_options(year)
+    except Exception as e:
+        logger.error(f"Failed to load season schedule for {year}: {e}")
+        event_options, event_map = [], {}
 
-    if schedule.empty:
+    if not event_options:
         # Fallback to text input
         event_identifier = st.sidebar.text_input(
             "Event",
@@ -63,29 +130,6 @@ def render_event_selector(
         )
         event_metadata = {"event_name": event_identifier, "round": None}
     else:
-        # Create event options
-        event_options = []
-        event_map = {}
-
-        for idx, row in schedule.iterrows():
-            # Build label: "Round X - Event Name (Location)"
-            round_num = row["RoundNumber"]
-            event_name = row["EventName"]
-            location = row["Location"] if "Location" in row else row.get("Country", "")
-
-            label = f"Round {round_num} - {event_name}"
-            if location and location != event_name:
-                label += f" ({location})"
-
-            event_options.append(label)
-            event_map[label] = {
-                "event_name": event_name,
-                "round": int(round_num),
-                "location": location,
-                "country": row.get("Country", ""),
-                "date": str(row.get("EventDate", "")),
-            }
-
         # Dropdown selector
         selected_label = st.sidebar.selectbox(
             "Event",
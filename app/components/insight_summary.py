@@ -7,17 +7,54 @@ Author: João Pedro Cunha
 """
 
 import streamlit as st
-from typing import Dict, Any, List, Optional
+from operator import attrgetter
+from typing import Dict, Any, List, Optional, Sequence, Union
 import pandas as pd
 import numpy as np
 
+# Per-phase time contribution fields of a CornerDecomposition, in breakdown order
+_PHASE_FIELDS = ("braking_contribution", "mid_corner_contribution", "traction_contribution")
+_PHASE_CONTRIBUTIONS = attrgetter(*_PHASE_FIELDS)
+_PHASE_NAMES = ("braking", "corner", "traction")
+_PHASE_LABELS = ("Braking", "Corner", "Traction")
+_SECTOR_LABELS = ("Sector 1", "Sector 2", "Sector 3")
+
+# Corners/decompositions: a list of objects, or a structured array with matching fields
+Records = Union[List[Any], np.ndarray]
+
+
+def _has_records(records: Optional[Records]) -> bool:
+    """True if records is a non-empty list or structured array."""
+    return records is not None and len(records) > 0
+
+
+def _phase_contributions(decompositions: Records) -> np.ndarray:
+    """(N, 3) array of braking/mid-corner/traction contributions."""
+    if isinstance(decompositions, np.ndarray):
+        return np.column_stack([decompositions[field] for field in _PHASE_FIELDS]).astype(
+            np.float64
+        )
+    # One pass over the decompositions
+    return np.fromiter(
+        (value for d in decompositions for value in _PHASE_CONTRIBUTIONS(d)),
+        dtype=np.float64,
+        count=3 * len(decompositions),
+    ).reshape(-1, 3)
+
+
+def _min_speeds(corners: Records, count: int) -> np.ndarray:
+    """Minimum speeds of the first count corners."""
+    if isinstance(corners, np.ndarray):
+        return corners["min_speed"][:count].astype(np.float64)
+    return np.fromiter((c.min_speed for c in corners[:count]), dtype=np.float64, count=count)
+
 
 def generate_insight_summary(
     comparison_summary: Dict[str, Any],
     minisector_data: Optional[pd.DataFrame],
-    corners1: Optional[List[Any]],
-    corners2: Optional[List[Any]],
-    decompositions: Optional[List[Any]],
+    corners1: Optional[Records],
+    corners2: Optional[Records],
+    decompositions: Optional[Records],
     driver1_name: str,
     driver2_name: str,
 ) -> Dict[str, Any]:
@@ -27,9 +64,11 @@ def generate_insight_summary(
     Args:
         comparison_summary: Comparison summary dictionary
         minisector_data: Minisector delta data (deprecated, not used)
-        corners1: Corner data for driver 1
-        corners2: Corner data for driver 2
-        decompositions: Corner delta decompositions
+        corners1: Corner data for driver 1 (list of Corner or structured array
+            with a min_speed field)
+        corners2: Corner data for driver 2 (same forms as corners1)
+        decompositions: Corner delta decompositions (list of CornerDecomposition or
+            structured array with the *_contribution fields)
         driver1_name: Driver 1 name
         driver2_name: Driver 2 name
 
@@ -48,45 +87,47 @@ def generate_insight_summary(
     # Sector-based analysis (3 sectors in F1)
     # We'll divide the lap into 3 sectors based on track distance
     if "delta_time" in comparison_summary and len(comparison_summary["delta_time"]) > 0:
-        total_distance = len(comparison_summary["delta_time"])
+        delta_time = np.asarray(comparison_summary["delta_time"], dtype=np.float64)
+        total_distance = delta_time.size
         sector_size = total_distance // 3
 
-        sectors_info = []
-        for sector_num in range(3):
-            start_idx = sector_num * sector_size
-            end_idx = (sector_num + 1) * sector_size if sector_num < 2 else total_distance
-
-            sector_deltas = comparison_summary["delta_time"][start_idx:end_idx]
-            sector_delta = sector_deltas[-1] - sector_deltas[0] if len(sector_deltas) > 0 else 0
+        # Sector bounds [start, end); a sector's delta is its last minus first sample
+        bounds = np.array([0, sector_size, 2 * sector_size, total_distance])
+        starts, ends = bounds[:-1], bounds[1:]
+        # Empty sectors (laps shorter than 3 samples) keep a zero delta
+        sector_deltas = np.subtract(
+            delta_time[np.maximum(ends - 1, 0)],
+            delta_time[starts],
+            out=np.zeros(3),
+            where=ends > starts,
+        )
+        # Python floats from here on; 0-d numpy scalar arithmetic is slower
+        sector_delta_values = sector_deltas.tolist()
+        insights["sector_breakdown"] = {
+            f"Sector {sector_num}": sector_delta
+            for sector_num, sector_delta in enumerate(sector_delta_values, 1)
+        }
 
-            sectors_info.append(
+        # Rank sectors by absolute delta (stable, so ties keep sector order)
+        order = np.argsort(-np.abs(sector_deltas), kind="stable")
+        for idx in order.tolist():
+            sector_delta = sector_delta_values[idx]
+            insights["top_locations"].append(
                 {
-                    "sector": f"Sector {sector_num + 1}",
+                    "sector": f"Sector {idx + 1}",
                     "delta": sector_delta,
                     "favoring": driver1_name if sector_delta < 0 else driver2_name,
                 }
             )
-            insights["sector_breakdown"][f"Sector {sector_num + 1}"] = sector_delta
-
-        # Add top sectors to top_locations
-        sectors_sorted = sorted(sectors_info, key=lambda x: abs(x["delta"]), reverse=True)
-        for sector_info in sectors_sorted:
-            insights["top_locations"].append(sector_info)
 
     # Breakdown: braking vs corner vs traction
-    if decompositions:
-        total_braking = sum(d.braking_contribution for d in decompositions)
-        total_corner = sum(d.mid_corner_contribution for d in decompositions)
-        total_traction = sum(d.traction_contribution for d in decompositions)
-
-        insights["breakdown"] = {
-            "braking": total_braking,
-            "corner": total_corner,
-            "traction": total_traction,
-        }
+    if _has_records(decompositions):
+        phase_totals = _phase_contributions(decompositions).sum(axis=0)
+        insights["breakdown"] = dict(zip(_PHASE_NAMES, phase_totals.tolist()))
 
-        # Key findings based on breakdown
-        max_phase = max(insights["breakdown"], key=lambda k: abs(insights["breakdown"][k]))
+        # Key findings based on breakdown (first phase wins ties, as with max())
+        max_phase_idx = int(np.argmax(np.abs(phase_totals)))
+        max_phase = _PHASE_NAMES[max_phase_idx]
         max_value = insights["breakdown"][max_phase]
 
         if abs(max_value) > 0.05:  # Threshold for significance
@@ -100,12 +141,12 @@ def generate_insight_summary(
                 )
 
     # Corner-specific insights
-    if corners1 and corners2:
+    if _has_records(corners1) and _has_records(corners2):
         min_corners = min(len(corners1), len(corners2))
         if min_corners > 0:
             # Compare minimum speeds
-            avg_min_speed_1 = np.mean([c.min_speed for c in corners1[:min_corners]])
-            avg_min_speed_2 = np.mean([c.min_speed for c in corners2[:min_corners]])
+            avg_min_speed_1 = _min_speeds(corners1, min_corners).mean()
+            avg_min_speed_2 = _min_speeds(corners2, min_corners).mean()
 
             if abs(avg_min_speed_1 - avg_min_speed_2) > 2.0:
                 if avg_min_speed_1 > avg_min_speed_2:
@@ -120,12 +161,37 @@ def generate_insight_summary(
     return insights
 
 
+@st.cache_data(show_spinner=False, max_entries=16)
+def _cached_insight_summary(
+    final_delta: float,
+    delta_time: Optional[np.ndarray],
+    corners1: Optional[Records],
+    corners2: Optional[Records],
+    decompositions: Optional[Records],
+    driver1_name: str,
+    driver2_name: str,
+) -> Dict[str, Any]:
+    """generate_insight_summary keyed only on the inputs it reads, reused across reruns."""
+    comparison_summary = {"final_delta": final_delta}
+    if delta_time is not None:
+        comparison_summary["delta_time"] = delta_time
+    return generate_insight_summary(
+        comparison_summary, None, corners1, corners2, decompositions, driver1_name, driver2_name
+    )
+
+
+def _render_metric_row(labels: Sequence[str], deltas: Sequence[float]) -> None:
+    """Render signed deltas as one row of metrics."""
+    for col, label, delta in zip(st.columns(len(labels)), labels, deltas):
+        col.metric(label, f"{delta:+.3f}s")
+
+
 def render_insight_summary(
     comparison_summary: Dict[str, Any],
     minisector_data: Optional[pd.DataFrame],
-    corners1: Optional[List[Any]],
-    corners2: Optional[List[Any]],
-    decompositions: Optional[List[Any]],
+    corners1: Optional[Records],
+    corners2: Optional[Records],
+    decompositions: Optional[Records],
     driver1_name: str,
     driver2_name: str,
 ) -> None:
@@ -141,9 +207,10 @@ def render_insight_summary(
         driver1_name: Driver 1 name
         driver2_name: Driver 2 name
     """
-    insights = generate_insight_summary(
-        comparison_summary,
-        minisector_data,
+    # minisector_data is unused by generate_insight_summary, so it is not part of the key
+    insights = _cached_insight_summary(
+        comparison_summary["final_delta"],
+        comparison_summary.get("delta_time"),
         corners1,
         corners2,
         decompositions,
@@ -154,61 +221,42 @@ def render_insight_summary(
     st.subheader("Insight Summary")
 
     # Total delta
-    delta_sign = "+" if insights["total_delta"] > 0 else ""
     st.markdown(
         f"**Overall:** {insights['faster_driver']} is **{abs(insights['total_delta']):.3f}s faster** "
-        f"({delta_sign}{insights['total_delta']:.3f}s)"
+        f"({insights['total_delta']:+.3f}s)"
     )
 
+    # Decide which metric rows are shown before allocating any column layouts;
+    # the sector row is skipped when every sector delta is zero or missing
+    sector_breakdown = insights["sector_breakdown"]
+    sector_deltas = [sector_breakdown.get(label, 0) for label in _SECTOR_LABELS]
+    show_sectors = any(sector_deltas)
+    breakdown = insights["breakdown"]
+    phase_deltas = [breakdown[phase] for phase in _PHASE_NAMES] if breakdown else []
+
     # Sector breakdown
-    if insights["sector_breakdown"]:
+    if show_sectors:
         st.markdown("**Sector Breakdown:**")
-        col1, col2, col3 = st.columns(3)
-
-        with col1:
-            sector1_delta = insights["sector_breakdown"].get("Sector 1", 0)
-            st.metric("Sector 1", f"{sector1_delta:+.3f}s")
-
-        with col2:
-            sector2_delta = insights["sector_breakdown"].get("Sector 2", 0)
-            st.metric("Sector 2", f"{sector2_delta:+.3f}s")
-
-        with col3:
-            sector3_delta = insights["sector_breakdown"].get("Sector 3", 0)
-            st.metric("Sector 3", f"{sector3_delta:+.3f}s")
+        _render_metric_row(_SECTOR_LABELS, sector_deltas)
 
     # Top sectors
     if insights["top_locations"]:
         st.markdown("**Sectors Ranked by Time Difference:**")
-        for i, loc in enumerate(insights["top_locations"], 1):
-            delta_sign = "+" if loc["delta"] > 0 else ""
-            st.markdown(
-                f"{i}. {loc['sector']}: "
-                f"{delta_sign}{loc['delta']:.3f}s favoring **{loc['favoring']}**"
-            )
+        ranked_lines = [
+            f"{i}. {loc['sector']}: {loc['delta']:+.3f}s favoring **{loc['favoring']}**"
+            for i, loc in enumerate(insights["top_locations"], 1)
+        ]
+        st.markdown("\n".join(ranked_lines))
 
     # Breakdown
-    if insights["breakdown"]:
+    if phase_deltas:
         st.markdown("**Performance Breakdown (by phase):**")
-        col1, col2, col3 = st.columns(3)
-
-        with col1:
-            braking = insights["breakdown"]["braking"]
-            st.metric("Braking", f"{braking:+.3f}s")
-
-        with col2:
-            corner = insights["breakdown"]["corner"]
-            st.metric("Corner", f"{corner:+.3f}s")
-
-        with col3:
-            traction = insights["breakdown"]["traction"]
-            st.metric("Traction", f"{traction:+.3f}s")
+        _render_metric_row(_PHASE_LABELS, phase_deltas)
 
     # Key findings
     if insights["key_findings"]:
         st.markdown("**Key Findings:**")
-        for finding in insights["key_findings"]:
-            st.markdown(f"- {finding}")
+        st.markdown("\n".join(f"- {finding}" for finding in insights["key_findings"]))
 
     # Assumptions & Limitations expander
     with st.expander("Assumptions & Limitations"):
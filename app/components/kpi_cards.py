@@ -8,6 +8,7 @@ Author: João Pedro Cunha
 
 import streamlit as st
 from typing import Dict, Any, Optional
+import numpy as np
 import pandas as pd
 
 
@@ -48,13 +49,20 @@ def render_kpi_cards(
         st.metric("Max Gap", f"{abs(max_gap):.3f}s", delta=f"at {max_gap_location:.0f}m")
 
     # Biggest gain segment
-    if minisector_data is not None and not minisector_data.empty:
-        # Find biggest gain and loss
-        max_gain_idx = minisector_data["Time_Delta"].idxmin()
-        max_loss_idx = minisector_data["Time_Delta"].idxmax()
+    # An all-NaN Time_Delta has no extremes to locate (nanargmin/nanargmax would raise)
+    if (
+        minisector_data is not None
+        and not minisector_data.empty
+        and minisector_data["Time_Delta"].notna().any()
+    ):
+        # Find biggest gain and loss (positional scans; NaN deltas skipped like idxmin/idxmax)
+        time_deltas = minisector_data["Time_Delta"].to_numpy(dtype=np.float64)
+        sectors = minisector_data["Minisector"].to_numpy()
+        max_gain_pos = int(np.nanargmin(time_deltas))
+        max_loss_pos = int(np.nanargmax(time_deltas))
 
-        max_gain_sector = minisector_data.loc[max_gain_idx, "Minisector"]
-        max_gain_delta = minisector_data.loc[max_gain_idx, "Time_Delta"]
+        max_gain_sector = sectors[max_gain_pos]
+        max_gain_delta = time_deltas[max_gain_pos]
 
         with col3:
             st.metric(
@@ -64,8 +72,8 @@ def render_kpi_cards(
                 delta_color="off",
             )
 
-        max_loss_sector = minisector_data.loc[max_loss_idx, "Minisector"]
-        max_loss_delta = minisector_data.loc[max_loss_idx, "Time_Delta"]
+        max_loss_sector = sectors[max_loss_pos]
+        max_loss_delta = time_deltas[max_loss_pos]
 
         with col4:
             st.metric(
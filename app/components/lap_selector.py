@@ -8,94 +8,143 @@ Author: João Pedro Cunha
 
 import streamlit as st
 from typing import Dict, Any, Optional, Tuple
+import numpy as np
 import pandas as pd
 from fastf1.core import Session
 
+# Dry-to-wet tyre order for the compound dropdown; other compounds follow alphabetically
+COMPOUND_ORDER = ("SOFT", "MEDIUM", "HARD", "INTERMEDIATE", "WET")
 
-def get_available_laps(
-    session: Session,
-    driver: str,
-    valid_only: bool = False,
-    exclude_in_out: bool = True,
-    compound_filter: Optional[str] = None,
-) -> pd.DataFrame:
+
+def _session_cache_key(session: Session) -> str:
+    """Hashable identifier for a loaded session, used as the lap table cache key."""
+    return f"{session.event['EventName']}|{session.name}|{session.date}"
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _compute_lap_table(session_key: str, driver: str, _session: Session) -> pd.DataFrame:
     """
-    Get available laps for a driver with metadata.
+    Build the full, unfiltered lap table (with display labels) for a driver.
+
+    The session itself is excluded from hashing (leading underscore); session_key
+    identifies it instead.
 
     Args:
-        session: FastF1 Session object
+        session_key: Identifier of the session (see _session_cache_key)
         driver: Three-letter driver code
-        valid_only: Only include valid laps
-        exclude_in_out: Exclude in/out laps
-        compound_filter: Filter by compound (SOFT, MEDIUM, HARD, etc.)
+        _session: FastF1 Session object
 
     Returns:
-        DataFrame with lap metadata
+        DataFrame with one row per lap
     """
-    driver_laps = session.laps.pick_driver(driver)
+    driver_laps = _session.laps.pick_driver(driver)
 
     if driver_laps.empty:
         return pd.DataFrame()
 
+    # Create display labels with column-wise string ops (one pass per column)
+    lap_numbers = driver_laps["LapNumber"].astype(int)
+    lap_times = driver_laps["LapTime"]
+
+    # Format lap time
+    if pd.api.types.is_numeric_dtype(lap_times):
+        lap_seconds = lap_times.astype(float)
+    else:
+        lap_seconds = pd.to_timedelta(lap_times).dt.total_seconds()
+    lap_time_strs = lap_seconds.map("{:.3f}s".format)
+
+    # Build label
+    labels = "Lap " + lap_numbers.astype(str) + " — " + lap_time_strs
+
+    # Add compound if available
+    if "Compound" in driver_laps.columns:
+        compounds = driver_laps["Compound"]
+        labels = labels.where(compounds.isna(), labels + " — " + compounds.astype(str))
+        # Categorical keeps the distinct compounds (in tyre order) for the dropdown
+        extra_compounds = sorted(set(compounds.dropna()) - set(COMPOUND_ORDER))
+        compounds = pd.Categorical(compounds, categories=list(COMPOUND_ORDER) + extra_compounds)
+    else:
+        compounds = None
+
+    # Add valid status
+    if "IsAccurate" in driver_laps.columns:
+        is_accurate = driver_laps["IsAccurate"]
+        labels = labels + np.where(is_accurate.astype(bool), " — Valid", " — Invalid")
+    else:
+        is_accurate = True
+
+    # Add session segment if available (Q1, Q2, Q3, etc.)
+    if "Stint" in driver_laps.columns:
+        stints = driver_laps["Stint"]
+        stint_strs = " — Stint " + stints.fillna(0).astype(int).astype(str)
+        labels = labels.where(stints.isna(), labels + stint_strs)
+
+    lap_table = pd.DataFrame(
+        {
+            "lap_number": lap_numbers,
+            "lap_time": lap_times,
+            "lap_time_str": lap_time_strs,
+            "label": labels,
+            "compound": compounds,
+            "is_accurate": is_accurate,
+        }
+    )
+
+    return lap_table.reset_index(drop=True)
+
+
+def _filter_lap_table(
+    lap_table: pd.DataFrame,
+    session: Session,
+    valid_only: bool,
+    exclude_in_out: bool,
+    compound_filter: Optional[str],
+) -> pd.DataFrame:
+    """Apply the lap selector filters to a lap table with boolean masks."""
+    if lap_table.empty:
+        return pd.DataFrame()
+
+    mask = np.ones(len(lap_table), dtype=bool)
+
     # Filter valid laps
-    if valid_only and "IsAccurate" in driver_laps.columns:
-        driver_laps = driver_laps[driver_laps["IsAccurate"]]
+    if valid_only and "IsAccurate" in session.laps.columns:
+        mask &= lap_table["is_accurate"].to_numpy(dtype=bool)
 
     # Exclude in/out laps (lap 1 and last lap typically)
     if exclude_in_out:
-        max_lap = driver_laps["LapNumber"].max()
-        driver_laps = driver_laps[
-            (driver_laps["LapNumber"] > 1) & (driver_laps["LapNumber"] < max_lap)
-        ]
+        lap_numbers = lap_table["lap_number"].to_numpy()
+        max_lap = lap_numbers[mask].max() if mask.any() else np.nan
+        mask &= (lap_numbers > 1) & (lap_numbers < max_lap)
 
     # Filter by compound
-    if compound_filter and compound_filter != "All" and "Compound" in driver_laps.columns:
-        driver_laps = driver_laps[driver_laps["Compound"] == compound_filter]
-
-    # Create display labels
-    lap_data = []
-    for idx, lap in driver_laps.iterrows():
-        lap_num = int(lap["LapNumber"])
-        lap_time = lap["LapTime"]
-
-        # Format lap time
-        if hasattr(lap_time, "total_seconds"):
-            lap_time_str = f"{lap_time.total_seconds():.3f}s"
-        else:
-            lap_time_str = f"{float(lap_time):.3f}s"
+    if compound_filter and compound_filter != "All" and "Compound" in session.laps.columns:
+        mask &= (lap_table["compound"] == compound_filter).to_numpy()
 
-        # Build label
-        label_parts = [f"Lap {lap_num}", lap_time_str]
+    return lap_table[mask].reset_index(drop=True)
 
-        # Add compound if available
-        if "Compound" in lap.index and pd.notna(lap["Compound"]):
-            label_parts.append(lap["Compound"])
 
-        # Add valid status
-        if "IsAccurate" in lap.index:
-            if lap["IsAccurate"]:
-                label_parts.append("Valid")
-            else:
-                label_parts.append("Invalid")
-
-        # Add session segment if available (Q1, Q2, Q3, etc.)
-        if "Stint" in lap.index and pd.notna(lap["Stint"]):
-            label_parts.append(f"Stint {int(lap['Stint'])}")
-
-        label = " — ".join(label_parts)
-
-        lap_data.append(
-            {
-                "lap_number": lap_num,
-                "lap_time": lap_time,
-                "lap_time_str": lap_time_str,
-                "label": label,
-                "compound": lap.get("Compound", None),
-                "is_accurate": lap.get("IsAccurate", True),
-            }
-        )
+def get_available_laps(
+    session: Session,
+    driver: str,
+    valid_only: bool = False,
+    exclude_in_out: bool = True,
+    compound_filter: Optional[str] = None,
+) -> pd.DataFrame:
+    """
+    Get available laps for a driver with metadata.
+
+    Args:
+        session: FastF1 Session object
+        driver: Three-letter driver code
+        valid_only: Only include valid laps
+        exclude_in_out: Exclude in/out laps
+        compound_filter: Filter by compound (SOFT, MEDIUM, HARD, etc.)
 
-    return pd.DataFrame(lap_data)
+    Returns:
+        DataFrame with lap metadata
+    """
+    lap_table = _compute_lap_table(_session_cache_key(session), driver, session)
+    return _filter_lap_table(lap_table, session, valid_only, exclude_in_out, compound_filter)
 
 
 def render_lap_selector(
@@ -153,15 +202,17 @@ def render_lap_selector(
                     "Exclude in/out laps", value=True, key=f"{key_prefix}_exclude_in_out"
                 )
 
-            # Compound filter (only if data available)
-            available_laps_all = get_available_laps(
-                session, driver, valid_only=False, exclude_in_out=False
-            )
+            # Compound filter (only if data available); the unfiltered table is
+            # fetched once and reused for the filtered lap list below
+            available_laps_all = _compute_lap_table(_session_cache_key(session), driver, session)
 
-            if not available_laps_all.empty and "compound" in available_laps_all.columns:
-                compounds = available_laps_all["compound"].dropna().unique().tolist()
+            if not available_laps_all.empty and isinstance(
+                available_laps_all["compound"].dtype, pd.CategoricalDtype
+            ):
+                compound_col = available_laps_all["compound"].cat.remove_unused_categories()
+                compounds = compound_col.cat.categories.tolist()
                 if compounds:
-                    compound_options = ["All"] + sorted(compounds)
+                    compound_options = ["All"] + compounds
                     compound_filter = st.selectbox(
                         "Tire compound", options=compound_options, key=f"{key_prefix}_compound"
                     )
@@ -171,9 +222,9 @@ def render_lap_selector(
                 compound_filter = None
 
         # Get available laps with filters
-        available_laps = get_available_laps(
+        available_laps = _filter_lap_table(
+            available_laps_all,
             session,
-            driver,
             valid_only=valid_only,
             exclude_in_out=exclude_in_out,
             compound_filter=compound_filter,
@@ -184,9 +235,12 @@ def render_lap_selector(
             lap_selection = "fastest"
             lap_metadata = {"lap_number": "N/A", "lap_time": "N/A", "compound": None}
         else:
-            # Create selectbox with lap labels
+            # Create selectbox with lap labels; metadata columns are read as plain
+            # arrays so the selection is looked up without building row Series
             lap_options = available_laps["label"].tolist()
             lap_numbers = available_laps["lap_number"].tolist()
+            lap_time_strs = available_laps["lap_time_str"].to_numpy()
+            lap_compounds = available_laps["compound"].to_numpy()
 
             selected_idx = st.selectbox(
                 f"Select lap for {driver}",
@@ -197,10 +251,11 @@ def render_lap_selector(
             )
 
             lap_selection = str(lap_numbers[selected_idx])
+            compound = lap_compounds[selected_idx]
             lap_metadata = {
                 "lap_number": lap_numbers[selected_idx],
-                "lap_time": available_laps.iloc[selected_idx]["lap_time_str"],
-                "compound": available_laps.iloc[selected_idx]["compound"],
+                "lap_time": lap_time_strs[selected_idx],
+                "compound": compound if pd.notna(compound) else None,
             }
 
     return lap_selection, lap_metadata
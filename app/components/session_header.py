@@ -10,6 +10,14 @@ import streamlit as st
 from typing import Dict, Any
 
 
+def _lap_summary_markdown(driver_name: str, lap_info: Dict[str, Any]) -> str:
+    """Build a driver's lap summary as one markdown block."""
+    lines = [f"- Lap: {lap_info['lap_number']}", f"- Time: {lap_info['lap_time']}"]
+    if "compound" in lap_info and lap_info["compound"]:
+        lines.append(f"- Compound: {lap_info['compound']}")
+    return f"**{driver_name}**\n\n" + "\n".join(lines)
+
+
 def render_session_header(
     session_info: Dict[str, Any],
     driver1_name: str,
@@ -33,8 +41,10 @@ def render_session_header(
     col1, col2, col3 = st.columns([2, 3, 2])
 
     with col1:
-        st.markdown(f"**Session:** {session_info['event_name']} - {session_info['session_type']}")
-        st.markdown(f"**Date:** {session_info['date']}")
+        st.markdown(
+            f"**Session:** {session_info['event_name']} - {session_info['session_type']}\n\n"
+            f"**Date:** {session_info['date']}"
+        )
 
     with col2:
         st.markdown(
@@ -51,17 +61,9 @@ def render_session_header(
     col1, col2 = st.columns(2)
 
     with col1:
-        st.markdown(f"**{driver1_name}**")
-        st.markdown(f"- Lap: {lap1_info['lap_number']}")
-        st.markdown(f"- Time: {lap1_info['lap_time']}")
-        if "compound" in lap1_info and lap1_info["compound"]:
-            st.markdown(f"- Compound: {lap1_info['compound']}")
+        st.markdown(_lap_summary_markdown(driver1_name, lap1_info))
 
     with col2:
-        st.markdown(f"**{driver2_name}**")
-        st.markdown(f"- Lap: {lap2_info['lap_number']}")
-        st.markdown(f"- Time: {lap2_info['lap_time']}")
-        if "compound" in lap2_info and lap2_info["compound"]:
-            st.markdown(f"- Compound: {lap2_info['compound']}")
+        st.markdown(_lap_summary_markdown(driver2_name, lap2_info))
 
     st.markdown("---")
@@ -7,30 +7,26 @@ Author: João Pedro Cunha
 """
 
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from importlib.util import find_spec
 from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-# Add app to path for components
-sys.path.insert(0, str(Path(__file__).parent))
+# Add src and app (for components) to path once; the script body reruns on every interaction
+for extra_path in (Path(__file__).parent.parent / "src", Path(__file__).parent):
+    if str(extra_path) not in sys.path:
+        sys.path.insert(0, str(extra_path))
 
 import streamlit as st
 import pandas as pd
+import plotly.graph_objects as go
 import logging
 
-from f1telemetry import (
-    config as cfg,
-    data_loader,
-    alignment,
-    physics,
-    metrics,
-    viz,
-    minisectors,
-    corners as corners_module,
-    delta_decomp,
-    gg_diagram,
-    braking_zones,
-)
+# Only the lightweight config module is imported up front; the analysis modules (scipy,
+# FastF1, plotting) are imported inside the functions that use them, so the first paint
+# before any data is loaded doesn't pay for them
+from f1telemetry import config as cfg
 
 # Import UI components
 from components import (
@@ -43,6 +39,9 @@ from components import (
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Static PNG rendering of charts needs the optional kaleido package
+STATIC_PLOTS_AVAILABLE = find_spec("kaleido") is not None
+
 # Page configuration - NO EMOJIS
 st.set_page_config(
     page_title="F1 Telemetry Physics Lab",
@@ -55,14 +54,24 @@ if "data_loaded" not in st.session_state:
     st.session_state.data_loaded = False
 
 
+@st.cache_resource(ttl=3600, show_spinner=False)
+def _get_fastf1_session(year: int, event: str, session_type: str):
+    """Load a FastF1 session's results once per (year, event, session type)."""
+    import fastf1
+
+    session = fastf1.get_session(year, event, session_type)
+    # The driver list only needs session results; skip the laps, telemetry, weather and
+    # race control downloads, which make up most of a cold load
+    session.load(laps=False, telemetry=False, weather=False, messages=False)
+    return session
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
 def get_available_drivers(year: int, event: str, session_type: str):
     """Get list of available drivers for a session."""
     try:
         # Try to load session to get drivers
-        import fastf1
-
-        session = fastf1.get_session(year, event, session_type)
-        session.load()
+        session = _get_fastf1_session(year, event, session_type)
 
         # Get unique drivers
         if hasattr(session, "drivers") and session.drivers is not None:
@@ -145,11 +154,8 @@ def sidebar_inputs():
     st.sidebar.markdown("---")
     st.sidebar.subheader("Driver Selection")
 
-    # Get available drivers (use cached fallback for initial render)
-    if "driver_list" not in st.session_state:
-        st.session_state.driver_list = get_available_drivers(year, event, session_type)
-
-    driver_list = st.session_state.driver_list
+    # Get available drivers (cached per session)
+    driver_list = get_available_drivers(year, event, session_type)
     driver_displays = [d["display"] for d in driver_list]
     driver_codes = {d["display"]: d["code"] for d in driver_list}
 
@@ -225,6 +231,13 @@ def sidebar_inputs():
 
     load_button = st.sidebar.button("Load Data", type="primary", use_container_width=True)
 
+    if STATIC_PLOTS_AVAILABLE:
+        st.sidebar.checkbox(
+            "Static plots (fast)",
+            key="static_plots",
+            help="Render charts as server-side images instead of interactive Plotly charts",
+        )
+
     return {
         "year": year,
         "event": event,
@@ -239,102 +252,329 @@ def sidebar_inputs():
     }
 
 
-def load_data(params):
-    """Load and process telemetry data."""
-    try:
-        with st.spinner("Loading session data..."):
-            # Create config
-            config = cfg.Config(
-                distance_resolution=params["resolution"],
-                num_minisectors=params["num_minisectors"],
-            )
+@st.cache_resource(ttl=3600, max_entries=8, show_spinner=False)
+def _load_comparison_data(
+    year: int,
+    event: str,
+    session_type: str,
+    driver1: str,
+    driver2: str,
+    lap1_selection: str,
+    lap2_selection: str,
+    _config: cfg.Config,
+):
+    """Load the session, laps and raw telemetry once per comparison and share across reruns."""
+    from f1telemetry import data_loader
+
+    return data_loader.load_lap_comparison_data(
+        year=year,
+        event=event,
+        session_type=session_type,
+        driver1=driver1,
+        driver2=driver2,
+        lap1_selection=lap1_selection,
+        lap2_selection=lap2_selection,
+        config=_config,
+    )
 
-            # Load data
-            lap1, lap2, tel1_raw, tel2_raw, session = data_loader.load_lap_comparison_data(
-                year=params["year"],
-                event=params["event"],
-                session_type=params["session_type"],
-                driver1=params["driver1"],
-                driver2=params["driver2"],
-                lap1_selection=params["lap1"],
-                lap2_selection=params["lap2"],
-                config=config,
-            )
 
-            # Align laps
-            tel1, tel2 = alignment.align_laps(tel1_raw, tel2_raw, config)
+@st.cache_data(ttl=3600, max_entries=16, show_spinner=False)
+def _session_info(year: int, event: str, session_type: str, _session) -> Dict[str, Any]:
+    """Session metadata, shared by every comparison loaded from the same session."""
+    from f1telemetry import data_loader
 
-            # Add physics channels
-            tel1 = physics.add_physics_channels(tel1, config)
-            tel2 = physics.add_physics_channels(tel2, config)
+    return data_loader.get_session_info(_session)
 
-            # Compute minisectors
-            with st.spinner("Computing minisector analysis..."):
-                minisector_data_obj = minisectors.compute_minisector_deltas(
-                    tel1, tel2, config.num_minisectors, config
-                )
-                # Convert to DataFrame for compatibility with components
-                minisector_data = minisectors.minisector_data_to_dataframe(minisector_data_obj)
-
-            # Detect corners using circuit info when available
-            with st.spinner("Detecting corners..."):
-                corners1 = corners_module.get_circuit_corners(session, tel1, config=config)
-                corners2 = corners_module.get_circuit_corners(session, tel2, config=config)
-
-            # Corner decomposition
-            with st.spinner("Analyzing delta decomposition..."):
-                decompositions = []
-                min_corners = min(len(corners1), len(corners2))
-                for i in range(min_corners):
-                    decomp = delta_decomp.decompose_corner_delta(
-                        corners1[i], corners2[i], tel1, tel2
-                    )
-                    decompositions.append(decomp)
-
-            # Detect braking zones
-            with st.spinner("Detecting braking zones..."):
-                braking_zones1 = braking_zones.detect_braking_zones(tel1, config)
-                braking_zones2 = braking_zones.detect_braking_zones(tel2, config)
-                braking_comparison = braking_zones.compare_braking_zones(
-                    braking_zones1, braking_zones2, params["driver1"], params["driver2"]
-                )
 
-            # Create comparison summary
-            comparison_summary = metrics.create_comparison_summary(
-                lap1,
-                lap2,
-                tel1,
-                tel2,
-                params["driver1"],
-                params["driver2"],
-                config,
+# Persisted to disk so aligned laps survive server restarts; FastF1's own cache only
+# covers the raw download, not the alignment and physics pass
+@st.cache_data(persist="disk", max_entries=16, show_spinner=False)
+def _aligned_laps(
+    tel1_raw: pd.DataFrame, tel2_raw: pd.DataFrame, resolution: float
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Align two raw laps and add physics channels; cached on the raw telemetry."""
+    from f1telemetry import alignment, physics
+
+    config = cfg.Config(distance_resolution=resolution)
+
+    tel1, tel2 = alignment.align_laps(tel1_raw, tel2_raw, config)
+
+    # The two laps are independent and the physics pass is NumPy-heavy, so run them in parallel
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        tel1, tel2 = executor.map(
+            partial(physics.add_physics_channels, config=config), (tel1, tel2)
+        )
+
+    return tel1, tel2
+
+
+def _align_with_physics(
+    tel1_raw: pd.DataFrame, tel2_raw: pd.DataFrame, resolution: float
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Align two raw laps and add physics channels, reusing earlier results for the same laps."""
+    # st.cache_data only hashes exact DataFrames, not FastF1's Telemetry subclass
+    return _aligned_laps(pd.DataFrame(tel1_raw), pd.DataFrame(tel2_raw), resolution)
+
+
+@st.cache_resource(max_entries=64, show_spinner=False)
+def _cached_figure(
+    data_key: str,
+    figure_name: str,
+    distance_range: Optional[Tuple[float, float]],
+    _build: Callable[[], go.Figure],
+) -> go.Figure:
+    """
+    Build a figure once per loaded comparison and share it across reruns.
+
+    The builder is excluded from hashing (leading underscore); data_key identifies the
+    loaded data and figure_name the chart. Cached figures are shared, so the zoom range
+    is applied here rather than by callers.
+
+    Args:
+        data_key: Identifier of the loaded comparison (set by load_data)
+        figure_name: Name of the chart within the page
+        distance_range: Optional (start, end) distance to zoom the x-axis to
+        _build: Zero-argument callable that builds the figure
+
+    Returns:
+        Plotly figure
+    """
+    fig = _build()
+    if distance_range:
+        fig.update_xaxes(range=distance_range)
+    return fig
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _figure_png(
+    data_key: str,
+    figure_name: str,
+    distance_range: Optional[Tuple[float, float]],
+    _fig: go.Figure,
+) -> bytes:
+    """PNG render of a cached figure; keyed like _cached_figure."""
+    return _fig.to_image(format="png", width=1400, height=_fig.layout.height)
+
+
+def _show_figure(
+    fig: go.Figure,
+    figure_name: str,
+    distance_range: Optional[Tuple[float, float]] = None,
+) -> None:
+    """Display a cached figure, as a static image when the sidebar toggle is on."""
+    if st.session_state.get("static_plots"):
+        try:
+            png = _figure_png(st.session_state.data_key, figure_name, distance_range, fig)
+            st.image(png, use_container_width=True)
+            return
+        except Exception as e:
+            logger.warning(f"Static render of {figure_name} failed, using Plotly: {e}")
+
+    st.plotly_chart(fig, use_container_width=True)
+
+
+def _downsample_for_plot(data, target: int = 2000):
+    """Every n-th row of a telemetry frame or array, keeping about `target` points."""
+    return data[:: max(1, len(data) // target)]
+
+
+@st.cache_resource
+def _load_executor() -> ThreadPoolExecutor:
+    """Worker pool shared by all sessions for background data loads."""
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="f1-load")
+
+
+def _compact_dtypes(telemetry: pd.DataFrame) -> pd.DataFrame:
+    """Downcast float64 telemetry channels to float32 to halve plot payloads."""
+    float_columns = telemetry.select_dtypes("float64").columns
+    return telemetry.astype(dict.fromkeys(float_columns, "float32"))
+
+
+# Runs on the load worker, which has no script context to draw a spinner into; the caches it
+# calls (_load_comparison_data, _aligned_laps, _session_info) disable theirs too
+@st.cache_resource(ttl=3600, max_entries=8, show_spinner=False)
+def _run_pipeline(
+    params: Dict[str, Any], _report_stage: Callable[[str], None] = lambda stage: None
+) -> Dict[str, Any]:
+    """
+    Load and process telemetry for a comparison.
+
+    Runs on a worker thread, so it must not touch st.session_state or render
+    anything; the caller stores the returned values. Results are cached on the
+    params, so reloading a comparison already analysed is served without recomputing;
+    callers must treat the returned values as read-only.
+
+    Args:
+        params: Sidebar parameters (see sidebar_inputs)
+        _report_stage: Called with the name of each processing stage as it starts
+
+    Returns:
+        Dict of session state values for the loaded comparison
+    """
+    from f1telemetry import (
+        braking_zones,
+        corners as corners_module,
+        delta_decomp,
+        metrics,
+        minisectors,
+    )
+
+    # Create config
+    config = cfg.Config(
+        distance_resolution=params["resolution"],
+        num_minisectors=params["num_minisectors"],
+    )
+
+    # Load data
+    lap1, lap2, tel1_raw, tel2_raw, session = _load_comparison_data(
+        params["year"],
+        params["event"],
+        params["session_type"],
+        params["driver1"],
+        params["driver2"],
+        params["lap1"],
+        params["lap2"],
+        config,
+    )
+
+    # Align laps and add physics channels (reused while the raw laps are unchanged)
+    _report_stage("Aligning laps")
+    tel1, tel2 = _align_with_physics(tel1_raw, tel2_raw, params["resolution"])
+
+    # Compute minisectors
+    _report_stage("Analysing minisectors and corners")
+    minisector_data_obj = minisectors.compute_minisector_deltas(
+        tel1, tel2, config.num_minisectors, config
+    )
+    # Convert to DataFrame for compatibility with components
+    minisector_data = minisectors.minisector_data_to_dataframe(minisector_data_obj)
+
+    # Detect corners using circuit info when available
+    corners1 = corners_module.get_circuit_corners(session, tel1, config=config)
+    corners2 = corners_module.get_circuit_corners(session, tel2, config=config)
+
+    # Corner decomposition (zip pairs corners up to the shorter list)
+    decompositions = [
+        delta_decomp.decompose_corner_delta(corner1, corner2, tel1, tel2)
+        for corner1, corner2 in zip(corners1, corners2)
+    ]
+
+    # Report tables are fixed once data is loaded; build them once for all pages
+    corner_report_table = corners_module.create_corner_report_table(
+        corners1, corners2, params["driver1"], params["driver2"]
+    )
+    decomp_table = (
+        delta_decomp.create_decomposition_table(
+            decompositions, params["driver1"], params["driver2"]
+        )
+        if decompositions
+        else pd.DataFrame()
+    )
+
+    # Detect braking zones
+    _report_stage("Detecting braking zones")
+    braking_zones1 = braking_zones.detect_braking_zones(tel1, config)
+    braking_zones2 = braking_zones.detect_braking_zones(tel2, config)
+    braking_comparison = braking_zones.compare_braking_zones(
+        braking_zones1, braking_zones2, params["driver1"], params["driver2"]
+    )
+
+    # Create comparison summary
+    _report_stage("Building comparison summary")
+    comparison_summary = metrics.create_comparison_summary(
+        lap1,
+        lap2,
+        tel1,
+        tel2,
+        params["driver1"],
+        params["driver2"],
+        config,
+    )
+
+    return {
+        # Full-precision laps; they also feed the G-G stats, QA page and exports
+        "telemetry1": tel1,
+        "telemetry2": tel2,
+        # Distance axis shared by the delta plots, extracted once per load
+        "tel1_distance": tel1["Distance"].to_numpy(),
+        # Strided float32 copies for the line plots only, so reruns don't re-slice the full laps
+        "plot_telemetry1": _compact_dtypes(_downsample_for_plot(tel1)),
+        "plot_telemetry2": _compact_dtypes(_downsample_for_plot(tel2)),
+        "comparison_summary": comparison_summary,
+        "lap1": lap1,
+        "lap2": lap2,
+        "session": session,
+        "session_info": _session_info(
+            params["year"], params["event"], params["session_type"], session
+        ),
+        "driver1_name": params["driver1"],
+        "driver2_name": params["driver2"],
+        "config": config,
+        "minisector_data": minisector_data,
+        "corners1": corners1,
+        "corners2": corners2,
+        "decompositions": decompositions,
+        "corner_report_table": corner_report_table,
+        "decomp_table": decomp_table,
+        "braking_zones1": braking_zones1,
+        "braking_zones2": braking_zones2,
+        "braking_comparison": braking_comparison,
+        "data_key": "|".join(
+            str(params[name])
+            for name in (
+                "year",
+                "event",
+                "session_type",
+                "driver1",
+                "lap1",
+                "driver2",
+                "lap2",
+                "resolution",
+                "num_minisectors",
             )
+        ),
+    }
 
-            # Store in session state
-            st.session_state.data_loaded = True
-            st.session_state.telemetry1 = tel1
-            st.session_state.telemetry2 = tel2
-            st.session_state.comparison_summary = comparison_summary
-            st.session_state.lap1 = lap1
-            st.session_state.lap2 = lap2
-            st.session_state.session = session
-            st.session_state.session_info = data_loader.get_session_info(session)
-            st.session_state.driver1_name = params["driver1"]
-            st.session_state.driver2_name = params["driver2"]
-            st.session_state.config = config
-            st.session_state.minisector_data = minisector_data
-            st.session_state.corners1 = corners1
-            st.session_state.corners2 = corners2
-            st.session_state.decompositions = decompositions
-            st.session_state.braking_zones1 = braking_zones1
-            st.session_state.braking_zones2 = braking_zones2
-            st.session_state.braking_comparison = braking_comparison
-
-            st.success("Data loaded successfully!")
 
+def load_data(params):
+    """Start loading and processing telemetry data in the background."""
+    # The worker records its current stage here; _poll_load shows it
+    progress = st.session_state.load_progress = {"stage": "Loading session data"}
+    st.session_state.load_future = _load_executor().submit(
+        _run_pipeline, params, partial(progress.__setitem__, "stage")
+    )
+
+
+@st.fragment(run_every=0.5)
+def _poll_load():
+    """Poll the background load; store its results and rerun the app once it finishes."""
+    future = st.session_state.load_future
+
+    if not future.done():
+        st.status(f"{st.session_state.load_progress['stage']}...", state="running")
+        return
+
+    del st.session_state.load_future
+    del st.session_state.load_progress
+
+    try:
+        st.session_state.update(future.result())
+        st.session_state.data_loaded = True
+        st.session_state.load_status = ("success", "Data loaded successfully!")
     except Exception as e:
-        st.error(f"Error loading data: {str(e)}")
-        logger.error(f"Data loading error: {e}", exc_info=True)
+        st.session_state.load_status = ("error", f"Error loading data: {str(e)}")
+        logger.error(f"Data loading error: {e}", exc_info=e)
+
+    st.rerun()
+
+
+@lru_cache(maxsize=256)
+def _format_seconds(total_seconds: float) -> str:
+    """Format a duration in seconds as M:SS.mmm."""
+    minutes = int(total_seconds // 60)
+    seconds = total_seconds % 60
+
+    return f"{minutes}:{seconds:06.3f}"
 
 
 def format_lap_time(lap_time):
@@ -344,15 +584,19 @@ def format_lap_time(lap_time):
         if pd.isna(lap_time):
             return "N/A"
 
-        total_seconds = lap_time.total_seconds()
-        minutes = int(total_seconds // 60)
-        seconds = total_seconds % 60
-
-        return f"{minutes}:{seconds:06.3f}"
+        return _format_seconds(lap_time.total_seconds())
     except Exception:
         return str(lap_time)
 
 
+# Session metadata shown on the overview, per column: (metric label, session_info key)
+_OVERVIEW_INFO_COLUMNS = [
+    [("Event", "event_name"), ("Country", "country")],
+    [("Location", "location"), ("Session", "session_type")],
+    [("Date", "date")],
+]
+
+
 def page_overview():
     """Overview page with session summary."""
     st.header("Session Overview")
@@ -365,30 +609,21 @@ def page_overview():
     info = st.session_state.session_info
 
     # Use 3 columns for better text display (avoid truncation)
-    col1, col2, col3 = st.columns(3)
-
-    with col1:
-        st.metric("Event", info["event_name"])
-        st.metric("Country", info["country"])
-
-    with col2:
-        st.metric("Location", info["location"])
-        st.metric("Session", info["session_type"])
-
-    with col3:
-        st.metric("Date", info["date"])
+    for col, fields in zip(st.columns(len(_OVERVIEW_INFO_COLUMNS)), _OVERVIEW_INFO_COLUMNS):
+        with col:
+            for label, key in fields:
+                st.metric(label, info[key])
 
     st.markdown("---")
 
     # Lap times in proper motor racing format
-    col1, col2 = st.columns(2)
-    with col1:
-        lap1_time = format_lap_time(st.session_state.lap1["LapTime"])
-        st.metric(f"{st.session_state.driver1_name} Lap Time", lap1_time)
-
-    with col2:
-        lap2_time = format_lap_time(st.session_state.lap2["LapTime"])
-        st.metric(f"{st.session_state.driver2_name} Lap Time", lap2_time)
+    laps = [
+        (st.session_state.driver1_name, st.session_state.lap1),
+        (st.session_state.driver2_name, st.session_state.lap2),
+    ]
+    for col, (driver_name, lap) in zip(st.columns(2), laps):
+        with col:
+            st.metric(f"{driver_name} Lap Time", format_lap_time(lap["LapTime"]))
 
     st.markdown("---")
 
@@ -428,110 +663,245 @@ def page_overview():
             st.metric("Braking Zones", len(st.session_state.braking_zones1))
 
 
-def page_lap_compare():
-    """Enhanced lap comparison page."""
-    st.header("Lap Comparison")
+def _create_track_animation(
+    tel1: pd.DataFrame,
+    tel2: pd.DataFrame,
+    driver1_name: str,
+    driver2_name: str,
+    config: cfg.Config,
+) -> go.Figure:
+    """Build the animated track map with both cars."""
+    # Downsample for smoother animation
+    step = max(1, len(tel1) // 200)  # Target ~200 frames
+
+    # Column arrays are pulled once; every frame below indexes into them
+    x1, y1 = tel1["X"].to_numpy(), tel1["Y"].to_numpy()
+    x2, y2 = tel2["X"].to_numpy(), tel2["Y"].to_numpy()
+
+    # WebGL traces, so each frame redraws on the GPU instead of re-laying out SVG
+    fig_anim = go.Figure()
+
+    # Add track outline
+    fig_anim.add_trace(
+        go.Scattergl(
+            x=x1,
+            y=y1,
+            mode="lines",
+            line=dict(color="gray", width=2),
+            name="Track",
+            showlegend=True,
+        )
+    )
 
-    if not st.session_state.data_loaded:
-        st.info("Load data using the sidebar to begin analysis")
-        return
+    # Add both cars as initial points
+    fig_anim.add_trace(
+        go.Scattergl(
+            x=[x1[0]],
+            y=[y1[0]],
+            mode="markers",
+            marker=dict(size=15, color=config.primary_color),
+            name=driver1_name,
+        )
+    )
 
-    # Car animation on track
-    if "X" in st.session_state.telemetry1.columns and "Y" in st.session_state.telemetry1.columns:
-        st.subheader("Track Animation")
+    fig_anim.add_trace(
+        go.Scattergl(
+            x=[x2[0]],
+            y=[y2[0]],
+            mode="markers",
+            marker=dict(size=15, color=config.secondary_color),
+            name=driver2_name,
+        )
+    )
 
-        try:
-            import plotly.graph_objects as go
-
-            # Create animation frames
-            tel1 = st.session_state.telemetry1
-            tel2 = st.session_state.telemetry2
-
-            # Downsample for smoother animation
-            step = max(1, len(tel1) // 200)  # Target ~200 frames
-
-            fig_anim = go.Figure()
-
-            # Add track outline
-            fig_anim.add_trace(
-                go.Scatter(
-                    x=tel1["X"],
-                    y=tel1["Y"],
-                    mode="lines",
-                    line=dict(color="gray", width=2),
-                    name="Track",
-                    showlegend=True,
-                )
+    # Create frames for animation; only the car markers move, so each frame
+    # updates traces 1 and 2 and the track outline stays in the base data
+    frames = []
+    for i in range(0, len(tel1), step):
+        frames.append(
+            go.Frame(
+                data=[
+                    go.Scattergl(x=[x1[i]], y=[y1[i]]),  # Driver 1
+                    go.Scattergl(x=[x2[i]], y=[y2[i]]),  # Driver 2
+                ],
+                traces=[1, 2],
+                name=str(i),
             )
+        )
 
-            # Add both cars as initial points
-            fig_anim.add_trace(
-                go.Scatter(
-                    x=[tel1["X"].iloc[0]],
-                    y=[tel1["Y"].iloc[0]],
-                    mode="markers",
-                    marker=dict(size=15, color=st.session_state.config.primary_color),
-                    name=st.session_state.driver1_name,
-                )
-            )
+    fig_anim.frames = frames
 
-            fig_anim.add_trace(
-                go.Scatter(
-                    x=[tel2["X"].iloc[0]],
-                    y=[tel2["Y"].iloc[0]],
-                    mode="markers",
-                    marker=dict(size=15, color=st.session_state.config.secondary_color),
-                    name=st.session_state.driver2_name,
-                )
-            )
+    # Add play/pause buttons
+    fig_anim.update_layout(
+        updatemenus=[
+            {
+                "type": "buttons",
+                "showactive": False,
+                "buttons": [
+                    {
+                        "label": "Play",
+                        "method": "animate",
+                        "args": [None, {"frame": {"duration": 50}}],
+                    },
+                    {
+                        "label": "Pause",
+                        "method": "animate",
+                        "args": [[None], {"frame": {"duration": 0}, "mode": "immediate"}],
+                    },
+                ],
+            }
+        ],
+        xaxis=dict(scaleanchor="y", scaleratio=1, showgrid=False),
+        yaxis=dict(showgrid=False),
+        plot_bgcolor="rgba(0,0,0,0)",
+        height=400,
+        uirevision="lap",
+    )
 
-            # Create frames for animation
-            frames = []
-            for i in range(0, len(tel1), step):
-                frames.append(
-                    go.Frame(
-                        data=[
-                            go.Scatter(x=tel1["X"], y=tel1["Y"]),  # Track
-                            go.Scatter(x=[tel1["X"].iloc[i]], y=[tel1["Y"].iloc[i]]),  # Driver 1
-                            go.Scatter(x=[tel2["X"].iloc[i]], y=[tel2["Y"].iloc[i]]),  # Driver 2
-                        ],
-                        name=str(i),
-                    )
-                )
+    return fig_anim
+
+
+def _create_gear_plot(
+    tel1: pd.DataFrame,
+    tel2: pd.DataFrame,
+    driver1_name: str,
+    driver2_name: str,
+    config: cfg.Config,
+) -> go.Figure:
+    """Build the gear-vs-distance comparison plot."""
+    fig_gear = go.Figure()
+
+    # Driver 1 gear
+    fig_gear.add_trace(
+        go.Scatter(
+            x=tel1["Distance"],
+            y=tel1["nGear"],
+            mode="lines",
+            name=driver1_name,
+            line=dict(color=config.primary_color, width=2),
+        )
+    )
 
-            fig_anim.frames = frames
+    # Driver 2 gear
+    fig_gear.add_trace(
+        go.Scatter(
+            x=tel2["Distance"],
+            y=tel2["nGear"],
+            mode="lines",
+            name=driver2_name,
+            line=dict(color=config.secondary_color, width=2),
+        )
+    )
 
-            # Add play/pause buttons
-            fig_anim.update_layout(
-                updatemenus=[
-                    {
-                        "type": "buttons",
-                        "showactive": False,
-                        "buttons": [
-                            {
-                                "label": "Play",
-                                "method": "animate",
-                                "args": [None, {"frame": {"duration": 50}}],
-                            },
-                            {
-                                "label": "Pause",
-                                "method": "animate",
-                                "args": [[None], {"frame": {"duration": 0}, "mode": "immediate"}],
-                            },
-                        ],
-                    }
-                ],
-                xaxis=dict(scaleanchor="y", scaleratio=1, showgrid=False),
-                yaxis=dict(showgrid=False),
-                plot_bgcolor="rgba(0,0,0,0)",
-                height=400,
+    fig_gear.update_layout(
+        xaxis_title="Distance (m)",
+        yaxis_title="Gear",
+        yaxis=dict(dtick=1),
+        height=400,
+        hovermode="x unified",
+        plot_bgcolor="rgba(0,0,0,0)",
+    )
+
+    return fig_gear
+
+
+def _create_fastest_driver_map(
+    tel1: pd.DataFrame,
+    delta_time,
+    driver1_name: str,
+    driver2_name: str,
+    config: cfg.Config,
+) -> go.Figure:
+    """Build the track map colored by which driver is ahead at each point."""
+    import numpy as np
+
+    tel1 = _downsample_for_plot(tel1)
+    delta_time = _downsample_for_plot(delta_time)
+
+    x = tel1["X"].to_numpy()
+    y = tel1["Y"].to_numpy()
+    distance = tel1["Distance"].to_numpy()
+
+    # Split the lap into runs where the same driver is ahead (based on cumulative delta);
+    # each run also takes the first point of the next one so the line stays continuous
+    driver1_ahead = np.asarray(delta_time < 0)
+    runs = np.split(np.arange(len(x)), np.flatnonzero(np.diff(driver1_ahead)) + 1)
+
+    fig_fastest = go.Figure()
+
+    # One polyline per driver, with NaN breaks between its runs
+    for ahead, color, name in (
+        (True, config.primary_color, driver1_name),
+        (False, config.secondary_color, driver2_name),
+    ):
+        segments = [
+            run if run[-1] + 1 == len(x) else np.append(run, run[-1] + 1)
+            for run in runs
+            if driver1_ahead[run[0]] == ahead
+        ]
+        x_line, y_line, distance_line = (
+            np.concatenate([np.append(values[seg], np.nan) for seg in segments] or [np.empty(0)])
+            for values in (x, y, distance)
+        )
+
+        fig_fastest.add_trace(
+            go.Scattergl(
+                x=x_line,
+                y=y_line,
+                mode="lines",
+                line=dict(color=color, width=6),
+                name=f"{name} faster",
+                hovertemplate="Distance: %{customdata:.0f}m<br>X: %{x}<br>Y: %{y}<extra></extra>",
+                customdata=distance_line,
             )
+        )
 
-            st.plotly_chart(fig_anim, use_container_width=True)
-        except Exception as e:
-            st.warning(f"Could not create track animation: {e}")
+    fig_fastest.update_layout(
+        xaxis=dict(scaleanchor="y", scaleratio=1, showgrid=False, title=""),
+        yaxis=dict(showgrid=False, title=""),
+        plot_bgcolor="rgba(0,0,0,0)",
+        height=600,
+        showlegend=True,
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+    )
 
-    st.markdown("---")
+    return fig_fastest
+
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _sector_deltas(
+    data_key: str, _distance: pd.Series, _delta_time
+) -> Dict[str, Tuple[Tuple[float, float], float]]:
+    """Three equal-distance sectors with the delta over each, once per loaded comparison."""
+    total_distance = _distance.max()
+    sector_size = total_distance / 3
+    bounds = [0, sector_size, 2 * sector_size, total_distance]
+
+    sectors = {}
+    for i in range(3):
+        distance_range = (bounds[i], bounds[i + 1])
+        start_idx = int(distance_range[0] / total_distance * len(_delta_time))
+        end_idx = int(distance_range[1] / total_distance * len(_delta_time))
+        sector_delta = (
+            _delta_time[end_idx - 1] - _delta_time[start_idx] if end_idx > start_idx else 0
+        )
+        sectors[f"Sector {i + 1}"] = (distance_range, sector_delta)
+
+    return sectors
+
+
+@st.fragment
+def _focus_region_plots() -> None:
+    """Focus region selector and telemetry plots; changing the region reruns only this fragment."""
+    from f1telemetry import viz
+
+    plot_tel1 = st.session_state.plot_telemetry1
+    plot_tel2 = st.session_state.plot_telemetry2
+    driver1_name = st.session_state.driver1_name
+    driver2_name = st.session_state.driver2_name
+    config = st.session_state.config
+    data_key = st.session_state.data_key
+    tel1_distance = st.session_state.tel1_distance
 
     # Region focus selector
     st.subheader("Focus Region")
@@ -547,15 +917,10 @@ def page_lap_compare():
 
     if focus_mode == "Sector":
         with col2:
-            # Define 3 sectors
-            total_distance = st.session_state.telemetry1["Distance"].max()
-            sector_size = total_distance / 3
-
-            sectors = {
-                "Sector 1": (0, sector_size),
-                "Sector 2": (sector_size, 2 * sector_size),
-                "Sector 3": (2 * sector_size, total_distance),
-            }
+            # 3 sectors and their deltas, computed once per loaded comparison
+            sectors = _sector_deltas(
+                data_key, tel1_distance, st.session_state.comparison_summary["delta_time"]
+            )
 
             selected_sector = st.selectbox(
                 "Select Sector",
@@ -563,15 +928,7 @@ def page_lap_compare():
                 key="lap_compare_sector",
             )
 
-            distance_range = sectors[selected_sector]
-
-            # Calculate sector delta
-            tel1_delta = st.session_state.comparison_summary["delta_time"]
-            start_idx = int(distance_range[0] / total_distance * len(tel1_delta))
-            end_idx = int(distance_range[1] / total_distance * len(tel1_delta))
-            sector_delta = (
-                tel1_delta[end_idx - 1] - tel1_delta[start_idx] if end_idx > start_idx else 0
-            )
+            distance_range, sector_delta = sectors[selected_sector]
 
             with col3:
                 st.metric("Delta", f"{sector_delta:+.3f}s")
@@ -602,104 +959,121 @@ def page_lap_compare():
 
     # Speed comparison
     st.subheader("Speed Comparison")
-    fig_speed = viz.create_speed_comparison_plot(
-        st.session_state.telemetry1,
-        st.session_state.telemetry2,
-        st.session_state.driver1_name,
-        st.session_state.driver2_name,
-        st.session_state.config,
+    fig_speed = _cached_figure(
+        data_key,
+        "speed",
+        distance_range,
+        partial(
+            viz.create_speed_comparison_plot,
+            plot_tel1,
+            plot_tel2,
+            driver1_name,
+            driver2_name,
+            config,
+        ),
     )
 
-    # Apply zoom if region selected
-    if distance_range:
-        fig_speed.update_xaxes(range=distance_range)
-
-    st.plotly_chart(fig_speed, use_container_width=True)
+    _show_figure(fig_speed, "speed", distance_range)
 
     # Delta time
     st.subheader("Delta Time Analysis")
-    fig_delta = viz.create_delta_time_plot(
-        st.session_state.comparison_summary["delta_time"],
-        st.session_state.telemetry1["Distance"].values,
-        st.session_state.driver1_name,
-        st.session_state.driver2_name,
-        st.session_state.config,
+    fig_delta = _cached_figure(
+        data_key,
+        "delta",
+        distance_range,
+        partial(
+            viz.create_delta_time_plot,
+            _downsample_for_plot(st.session_state.comparison_summary["delta_time"]),
+            _downsample_for_plot(tel1_distance),
+            driver1_name,
+            driver2_name,
+            config,
+        ),
     )
 
-    # Apply zoom if region selected
-    if distance_range:
-        fig_delta.update_xaxes(range=distance_range)
-
-    st.plotly_chart(fig_delta, use_container_width=True)
+    _show_figure(fig_delta, "delta", distance_range)
 
     # Throttle & Brake
-    st.subheader("Throttle & Brake Application")
-    fig_tb = viz.create_throttle_brake_plot(
-        st.session_state.telemetry1,
-        st.session_state.telemetry2,
-        st.session_state.driver1_name,
-        st.session_state.driver2_name,
-        st.session_state.config,
-    )
+    with st.expander("Throttle & Brake Application"):
+        fig_tb = _cached_figure(
+            data_key,
+            "throttle_brake",
+            distance_range,
+            partial(
+                viz.create_throttle_brake_plot,
+                plot_tel1,
+                plot_tel2,
+                driver1_name,
+                driver2_name,
+                config,
+            ),
+        )
+        _show_figure(fig_tb, "throttle_brake", distance_range)
 
-    # Apply zoom if region selected
-    if distance_range:
-        fig_tb.update_xaxes(range=distance_range)
+    # Gear comparison (nGear)
+    if "nGear" in plot_tel1.columns and "nGear" in plot_tel2.columns:
+        with st.expander("Gear Comparison"):
+            try:
+                fig_gear = _cached_figure(
+                    data_key,
+                    "gear",
+                    distance_range,
+                    partial(
+                        _create_gear_plot,
+                        plot_tel1,
+                        plot_tel2,
+                        driver1_name,
+                        driver2_name,
+                        config,
+                    ),
+                )
+                _show_figure(fig_gear, "gear", distance_range)
+            except Exception as e:
+                st.warning(f"Could not create gear plot: {e}")
+    else:
+        st.info("Gear data (nGear) not available for this session")
 
-    st.plotly_chart(fig_tb, use_container_width=True)
 
-    # Gear comparison (nGear)
-    if (
-        "nGear" in st.session_state.telemetry1.columns
-        and "nGear" in st.session_state.telemetry2.columns
-    ):
-        st.subheader("Gear Comparison")
+@st.fragment
+def page_lap_compare():
+    """Enhanced lap comparison page."""
+    st.header("Lap Comparison")
 
-        try:
-            import plotly.graph_objects as go
-
-            fig_gear = go.Figure()
-
-            # Driver 1 gear
-            fig_gear.add_trace(
-                go.Scatter(
-                    x=st.session_state.telemetry1["Distance"],
-                    y=st.session_state.telemetry1["nGear"],
-                    mode="lines",
-                    name=st.session_state.driver1_name,
-                    line=dict(color=st.session_state.config.primary_color, width=2),
-                )
-            )
+    if not st.session_state.data_loaded:
+        st.info("Load data using the sidebar to begin analysis")
+        return
 
-            # Driver 2 gear
-            fig_gear.add_trace(
-                go.Scatter(
-                    x=st.session_state.telemetry2["Distance"],
-                    y=st.session_state.telemetry2["nGear"],
-                    mode="lines",
-                    name=st.session_state.driver2_name,
-                    line=dict(color=st.session_state.config.secondary_color, width=2),
+    tel1 = st.session_state.telemetry1
+    tel2 = st.session_state.telemetry2
+    driver1_name = st.session_state.driver1_name
+    driver2_name = st.session_state.driver2_name
+    config = st.session_state.config
+    data_key = st.session_state.data_key
+
+    # Car animation on track (frames are built once per comparison)
+    if "X" in tel1.columns and "Y" in tel1.columns:
+        with st.expander("Track Animation"):
+            try:
+                fig_anim = _cached_figure(
+                    data_key,
+                    "track_animation",
+                    None,
+                    partial(
+                        _create_track_animation,
+                        tel1,
+                        tel2,
+                        driver1_name,
+                        driver2_name,
+                        config,
+                    ),
                 )
-            )
+                st.plotly_chart(fig_anim, use_container_width=True)
+            except Exception as e:
+                st.warning(f"Could not create track animation: {e}")
 
-            fig_gear.update_layout(
-                xaxis_title="Distance (m)",
-                yaxis_title="Gear",
-                yaxis=dict(dtick=1),
-                height=400,
-                hovermode="x unified",
-                plot_bgcolor="rgba(0,0,0,0)",
-            )
-
-            # Apply zoom if region selected
-            if distance_range:
-                fig_gear.update_xaxes(range=distance_range)
+    st.markdown("---")
 
-            st.plotly_chart(fig_gear, use_container_width=True)
-        except Exception as e:
-            st.warning(f"Could not create gear plot: {e}")
-    else:
-        st.info("Gear data (nGear) not available for this session")
+    _focus_region_plots()
 
 
 def page_minisectors():
@@ -710,28 +1084,35 @@ def page_minisectors():
         st.info("Load data using the sidebar to begin analysis")
         return
 
+    from f1telemetry import braking_zones, delta_decomp
+
+    braking_comparison = st.session_state.braking_comparison
+    decompositions = st.session_state.decompositions
+    driver1_name = st.session_state.driver1_name
+    driver2_name = st.session_state.driver2_name
+    config = st.session_state.config
+    data_key = st.session_state.data_key
+
     # Braking zones analysis
     st.subheader("Braking Zones Analysis")
 
-    if not st.session_state.braking_comparison.empty:
+    if not braking_comparison.empty:
         st.markdown("**Zone-by-Zone Comparison**")
-        driver1 = st.session_state.driver1_name
-        driver2 = st.session_state.driver2_name
         st.dataframe(
-            st.session_state.braking_comparison[
+            braking_comparison[
                 [
                     "Zone_ID",
-                    f"Start_Dist_{driver1}",
-                    f"Start_Dist_{driver2}",
+                    f"Start_Dist_{driver1_name}",
+                    f"Start_Dist_{driver2_name}",
                     "Brake_Start_Delta_m",
-                    f"Entry_Speed_{driver1}",
-                    f"Entry_Speed_{driver2}",
+                    f"Entry_Speed_{driver1_name}",
+                    f"Entry_Speed_{driver2_name}",
                     "Entry_Speed_Delta",
-                    f"Min_Speed_{driver1}",
-                    f"Min_Speed_{driver2}",
+                    f"Min_Speed_{driver1_name}",
+                    f"Min_Speed_{driver2_name}",
                     "Min_Speed_Delta",
-                    f"Max_Decel_{driver1}",
-                    f"Max_Decel_{driver2}",
+                    f"Max_Decel_{driver1_name}",
+                    f"Max_Decel_{driver2_name}",
                     "Max_Decel_Delta",
                 ]
             ],
@@ -742,12 +1123,12 @@ def page_minisectors():
         # Top differences
         st.markdown("**Top 3 Most Different Braking Zones**")
         top_gains, top_losses = braking_zones.get_top_braking_differences(
-            st.session_state.braking_comparison, n=3, sort_by="Brake_Start_Delta_m"
+            braking_comparison, n=3, sort_by="Brake_Start_Delta_m"
         )
 
         col1, col2 = st.columns(2)
         with col1:
-            st.markdown(f"**Later Braking ({st.session_state.driver1_name})**")
+            st.markdown(f"**Later Braking ({driver1_name})**")
             if not top_gains.empty:
                 st.dataframe(
                     top_gains[
@@ -761,7 +1142,7 @@ def page_minisectors():
                     hide_index=True,
                 )
         with col2:
-            st.markdown(f"**Earlier Braking ({st.session_state.driver1_name})**")
+            st.markdown(f"**Earlier Braking ({driver1_name})**")
             if not top_losses.empty:
                 st.dataframe(
                     top_losses[
@@ -783,151 +1164,74 @@ def page_minisectors():
     st.markdown("---")
     st.subheader("Corner Delta Decomposition")
 
-    if st.session_state.decompositions:
+    if decompositions:
         # Waterfall chart
-        fig_waterfall = delta_decomp.create_decomposition_waterfall(
-            st.session_state.decompositions,
-            st.session_state.driver1_name,
-            st.session_state.driver2_name,
-            st.session_state.config,
+        fig_waterfall = _cached_figure(
+            data_key,
+            "decomposition_waterfall",
+            None,
+            partial(
+                delta_decomp.create_decomposition_waterfall,
+                decompositions,
+                driver1_name,
+                driver2_name,
+                config,
+            ),
         )
-        st.plotly_chart(fig_waterfall, use_container_width=True)
+        _show_figure(fig_waterfall, "decomposition_waterfall")
 
         # Phase contribution bar
-        fig_phases = delta_decomp.create_phase_contribution_bar(
-            st.session_state.decompositions,
-            st.session_state.driver1_name,
-            st.session_state.driver2_name,
-            st.session_state.config,
+        fig_phases = _cached_figure(
+            data_key,
+            "phase_contribution",
+            None,
+            partial(
+                delta_decomp.create_phase_contribution_bar,
+                decompositions,
+                driver1_name,
+                driver2_name,
+                config,
+            ),
         )
-        st.plotly_chart(fig_phases, use_container_width=True)
+        _show_figure(fig_phases, "phase_contribution")
 
         # Decomposition table
         st.subheader("Detailed Decomposition Table")
-        decomp_table = delta_decomp.create_decomposition_table(
-            st.session_state.decompositions,
-            st.session_state.driver1_name,
-            st.session_state.driver2_name,
-        )
-        st.dataframe(decomp_table, use_container_width=True, hide_index=True)
+        st.dataframe(st.session_state.decomp_table, use_container_width=True, hide_index=True)
 
         # Weakness pattern analysis
-        pattern = delta_decomp.analyze_weakness_pattern(st.session_state.decompositions)
+        pattern = delta_decomp.analyze_weakness_pattern(decompositions)
         st.markdown("---")
         st.subheader("Performance Pattern Analysis")
 
         col1, col2 = st.columns(2)
         with col1:
             st.markdown("**Phase Distribution:**")
-            for phase, pct in pattern["phase_percentages"].items():
-                st.markdown(f"- {phase.replace('_', ' ').title()}: {pct:.1f}%")
+            st.markdown(
+                "\n".join(
+                    f"- {phase.replace('_', ' ').title()}: {pct:.1f}%"
+                    for phase, pct in pattern["phase_percentages"].items()
+                )
+            )
 
         with col2:
             st.markdown(
                 f"**Primary Weakness:** {pattern['primary_weakness'].replace('_', ' ').title()}"
             )
             st.markdown("**Total Delta by Phase:**")
-            for phase, delta in pattern["phase_total_deltas"].items():
-                st.markdown(f"- {phase.replace('_', ' ').title()}: {delta:+.3f}s")
-
-
-def page_track_map():
-    """Track map with corner markers and fastest driver comparison."""
-    st.header("Track Map & Corner Catalog")
-
-    if not st.session_state.data_loaded:
-        st.info("Load data using the sidebar to begin analysis")
-        return
-
-    # Check for position data
-    if "X" not in st.session_state.telemetry1.columns:
-        st.warning(
-            "Position data (X, Y) not available for this session. Track maps cannot be displayed."
-        )
-        return
-
-    # Fastest driver comparison map
-    st.subheader("Fastest Driver by Track Region")
-
-    try:
-        import plotly.graph_objects as go
-        import numpy as np
-
-        tel1 = st.session_state.telemetry1
-        tel2 = st.session_state.telemetry2
-
-        # Calculate who is faster at each point (based on cumulative delta)
-        delta_time = st.session_state.comparison_summary["delta_time"]
-
-        # Create color array (driver 1 faster = primary color, driver 2 faster = secondary color)
-        colors = np.where(
-            delta_time < 0,
-            st.session_state.config.primary_color,
-            st.session_state.config.secondary_color,
-        )
-
-        # Create scatter plot with colored segments
-        fig_fastest = go.Figure()
-
-        # Add track colored by fastest driver
-        fig_fastest.add_trace(
-            go.Scatter(
-                x=tel1["X"],
-                y=tel1["Y"],
-                mode="markers",
-                marker=dict(
-                    size=8,
-                    color=colors,
-                    colorscale=[
-                        [0, st.session_state.config.primary_color],
-                        [1, st.session_state.config.secondary_color],
-                    ],
-                    showscale=False,
-                ),
-                showlegend=False,  # Don't show track in legend
-                hovertemplate="Distance: %{text}<br>X: %{x}<br>Y: %{y}<extra></extra>",
-                text=[f"{d:.0f}m" for d in tel1["Distance"]],
+            st.markdown(
+                "\n".join(
+                    f"- {phase.replace('_', ' ').title()}: {delta:+.3f}s"
+                    for phase, delta in pattern["phase_total_deltas"].items()
+                )
             )
-        )
 
-        fig_fastest.update_layout(
-            xaxis=dict(scaleanchor="y", scaleratio=1, showgrid=False, title=""),
-            yaxis=dict(showgrid=False, title=""),
-            plot_bgcolor="rgba(0,0,0,0)",
-            height=600,
-            showlegend=True,
-            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
-        )
 
-        # Add legend manually
-        fig_fastest.add_trace(
-            go.Scatter(
-                x=[None],
-                y=[None],
-                mode="markers",
-                marker=dict(size=10, color=st.session_state.config.primary_color),
-                showlegend=True,
-                name=f"{st.session_state.driver1_name} faster",
-            )
-        )
+@st.fragment
+def _corner_catalog_map() -> None:
+    """Corner markers map; switching the driver reruns only this fragment."""
+    from f1telemetry import corners as corners_module
 
-        fig_fastest.add_trace(
-            go.Scatter(
-                x=[None],
-                y=[None],
-                mode="markers",
-                marker=dict(size=10, color=st.session_state.config.secondary_color),
-                showlegend=True,
-                name=f"{st.session_state.driver2_name} faster",
-            )
-        )
-
-        st.plotly_chart(fig_fastest, use_container_width=True)
-    except Exception as e:
-        st.error(f"Error creating fastest driver map: {e}")
-
-    # Corner markers map
-    st.markdown("---")
     st.subheader("Corner Catalog Map")
 
     driver_choice = st.radio(
@@ -950,18 +1254,70 @@ def page_track_map():
         else st.session_state.corners2
     )
 
-    if corners_choice:
-        try:
-            fig_corners_map = corners_module.create_corner_markers_map(
+    if not corners_choice:
+        st.info("No corners detected in telemetry data.")
+        return
+
+    try:
+        fig_corners_map = _cached_figure(
+            st.session_state.data_key,
+            f"corner_map|{driver_choice}",
+            None,
+            partial(
+                corners_module.create_corner_markers_map,
                 tel_choice,
                 corners_choice,
                 driver_choice,
                 st.session_state.config,
-            )
-            st.plotly_chart(fig_corners_map, use_container_width=True)
-        except Exception as e:
-            st.error(f"Error creating corner map: {e}")
+            ),
+        )
+        _show_figure(fig_corners_map, f"corner_map|{driver_choice}")
+    except Exception as e:
+        st.error(f"Error creating corner map: {e}")
+
+
+@st.fragment
+def page_track_map():
+    """Track map with corner markers and fastest driver comparison."""
+    st.header("Track Map & Corner Catalog")
+
+    if not st.session_state.data_loaded:
+        st.info("Load data using the sidebar to begin analysis")
+        return
+
+    # Check for position data
+    if "X" not in st.session_state.telemetry1.columns:
+        st.warning(
+            "Position data (X, Y) not available for this session. Track maps cannot be displayed."
+        )
+        return
 
+    # Fastest driver comparison map
+    st.subheader("Fastest Driver by Track Region")
+
+    try:
+        fig_fastest = _cached_figure(
+            st.session_state.data_key,
+            "fastest_driver_map",
+            None,
+            partial(
+                _create_fastest_driver_map,
+                st.session_state.telemetry1,
+                st.session_state.comparison_summary["delta_time"],
+                st.session_state.driver1_name,
+                st.session_state.driver2_name,
+                st.session_state.config,
+            ),
+        )
+        _show_figure(fig_fastest, "fastest_driver_map")
+    except Exception as e:
+        st.error(f"Error creating fastest driver map: {e}")
+
+    # Corner markers map
+    st.markdown("---")
+    _corner_catalog_map()
+
+    if not st.session_state.corner_report_table.empty:
         # Corner comparison table
         st.markdown("---")
         st.subheader("Corner-by-Corner Comparison")
@@ -977,12 +1333,7 @@ def page_track_map():
         with col2:
             sort_ascending = st.checkbox("Ascending", value=True, key="corner_sort_asc")
 
-        corner_table = corners_module.create_corner_report_table(
-            st.session_state.corners1,
-            st.session_state.corners2,
-            st.session_state.driver1_name,
-            st.session_state.driver2_name,
-        )
+        corner_table = st.session_state.corner_report_table
 
         # Sort table
         if not corner_table.empty:
@@ -1019,8 +1370,46 @@ def page_track_map():
                     ["Corner", "Min_Speed_Delta", "Apex_Distance"]
                 ]
                 st.dataframe(top_slowest, hide_index=True)
-    else:
-        st.info("No corners detected in telemetry data.")
+
+
+# Grip utilization stats shown on the G-G page: (row label, stats key, format)
+_GRIP_STAT_ROWS = [
+    ("Max Longitudinal Accel", "max_longitudinal_accel_g", "{:.2f}g"),
+    ("Max Braking Decel", "max_longitudinal_decel_g", "{:.2f}g"),
+    ("Max Lateral", "max_lateral_accel_g", "{:.2f}g"),
+    ("Max Combined", "max_combined_g", "{:.2f}g"),
+    ("Time Braking", "percent_time_braking", "{:.1f}%"),
+    ("Time Accelerating", "percent_time_accelerating", "{:.1f}%"),
+]
+
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _grip_stats(
+    data_key: str, _telemetry1: pd.DataFrame, _telemetry2: pd.DataFrame, _config: cfg.Config
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Grip utilization stats for both laps, computed once per loaded comparison."""
+    from f1telemetry import gg_diagram
+
+    return tuple(
+        gg_diagram.analyze_grip_utilization(gg_diagram.compute_accelerations(telemetry, _config))
+        for telemetry in (_telemetry1, _telemetry2)
+    )
+
+
+def _grip_stats_table(
+    stats1: Dict[str, Any], stats2: Dict[str, Any], driver1_name: str, driver2_name: str
+) -> pd.DataFrame:
+    """Format both drivers' grip utilization stats as one table, a column per driver."""
+    columns = [driver1_name, driver2_name]
+    if driver1_name == driver2_name:
+        # Two laps of the same driver; Arrow needs distinct column names
+        columns = [f"{driver1_name} (lap 1)", f"{driver2_name} (lap 2)"]
+
+    return pd.DataFrame(
+        [[fmt.format(stats1[key]), fmt.format(stats2[key])] for _, key, fmt in _GRIP_STAT_ROWS],
+        index=[label for label, _, _ in _GRIP_STAT_ROWS],
+        columns=columns,
+    )
 
 
 def page_gg_diagram():
@@ -1031,6 +1420,8 @@ def page_gg_diagram():
         st.info("Load data using the sidebar to begin analysis")
         return
 
+    from f1telemetry import gg_diagram
+
     # G-G diagram
     st.subheader("G-G Diagram (Friction Circle)")
 
@@ -1044,14 +1435,20 @@ def page_gg_diagram():
     )
 
     try:
-        fig_gg = gg_diagram.create_gg_plot(
-            st.session_state.telemetry1,
-            st.session_state.telemetry2,
-            st.session_state.driver1_name,
-            st.session_state.driver2_name,
-            st.session_state.config,
+        fig_gg = _cached_figure(
+            st.session_state.data_key,
+            "gg_diagram",
+            None,
+            partial(
+                gg_diagram.create_gg_plot,
+                st.session_state.telemetry1,
+                st.session_state.telemetry2,
+                st.session_state.driver1_name,
+                st.session_state.driver2_name,
+                st.session_state.config,
+            ),
         )
-        st.plotly_chart(fig_gg, use_container_width=True)
+        _show_figure(fig_gg, "gg_diagram")
     except Exception as e:
         st.error(f"Error creating G-G diagram: {e}")
 
@@ -1060,14 +1457,20 @@ def page_gg_diagram():
     st.subheader("Combined G-Force vs Distance")
 
     try:
-        fig_combined_g = gg_diagram.create_combined_g_force_plot(
-            st.session_state.telemetry1,
-            st.session_state.telemetry2,
-            st.session_state.driver1_name,
-            st.session_state.driver2_name,
-            st.session_state.config,
+        fig_combined_g = _cached_figure(
+            st.session_state.data_key,
+            "combined_g_force",
+            None,
+            partial(
+                gg_diagram.create_combined_g_force_plot,
+                st.session_state.telemetry1,
+                st.session_state.telemetry2,
+                st.session_state.driver1_name,
+                st.session_state.driver2_name,
+                st.session_state.config,
+            ),
         )
-        st.plotly_chart(fig_combined_g, use_container_width=True)
+        _show_figure(fig_combined_g, "combined_g_force")
     except Exception as e:
         st.error(f"Error creating combined g-force plot: {e}")
 
@@ -1076,40 +1479,40 @@ def page_gg_diagram():
     st.subheader("Grip Utilization Statistics")
 
     try:
-        accel1 = gg_diagram.compute_accelerations(
-            st.session_state.telemetry1, st.session_state.config
+        stats1, stats2 = _grip_stats(
+            st.session_state.data_key,
+            st.session_state.telemetry1,
+            st.session_state.telemetry2,
+            st.session_state.config,
         )
-        accel2 = gg_diagram.compute_accelerations(
-            st.session_state.telemetry2, st.session_state.config
+
+        st.table(
+            _grip_stats_table(
+                stats1, stats2, st.session_state.driver1_name, st.session_state.driver2_name
+            )
         )
 
-        stats1 = gg_diagram.analyze_grip_utilization(accel1)
-        stats2 = gg_diagram.analyze_grip_utilization(accel2)
+    except Exception as e:
+        st.error(f"Error computing grip statistics: {e}")
 
-        col1, col2 = st.columns(2)
 
-        with col1:
-            st.markdown(f"**{st.session_state.driver1_name}**")
-            st.markdown(f"- Max Longitudinal Accel: {stats1['max_longitudinal_accel_g']:.2f}g")
-            st.markdown(f"- Max Braking Decel: {stats1['max_longitudinal_decel_g']:.2f}g")
-            st.markdown(f"- Max Lateral: {stats1['max_lateral_accel_g']:.2f}g")
-            st.markdown(f"- Max Combined: {stats1['max_combined_g']:.2f}g")
-            st.markdown(f"- Time Braking: {stats1['percent_time_braking']:.1f}%")
-            st.markdown(f"- Time Accelerating: {stats1['percent_time_accelerating']:.1f}%")
+def _telemetry_preview(
+    tel1: pd.DataFrame, tel2: pd.DataFrame, driver1_name: str, driver2_name: str
+) -> None:
+    """Per-driver telemetry tabs."""
+    # The grid scrolls the full lap
+    tab1, tab2 = st.tabs([driver1_name, driver2_name])
 
-        with col2:
-            st.markdown(f"**{st.session_state.driver2_name}**")
-            st.markdown(f"- Max Longitudinal Accel: {stats2['max_longitudinal_accel_g']:.2f}g")
-            st.markdown(f"- Max Braking Decel: {stats2['max_longitudinal_decel_g']:.2f}g")
-            st.markdown(f"- Max Lateral: {stats2['max_lateral_accel_g']:.2f}g")
-            st.markdown(f"- Max Combined: {stats2['max_combined_g']:.2f}g")
-            st.markdown(f"- Time Braking: {stats2['percent_time_braking']:.1f}%")
-            st.markdown(f"- Time Accelerating: {stats2['percent_time_accelerating']:.1f}%")
+    with tab1:
+        st.dataframe(tel1, use_container_width=True, height=400, hide_index=True)
+        st.markdown(f"**Total samples:** {len(tel1)}")
 
-    except Exception as e:
-        st.error(f"Error computing grip statistics: {e}")
+    with tab2:
+        st.dataframe(tel2, use_container_width=True, height=400, hide_index=True)
+        st.markdown(f"**Total samples:** {len(tel2)}")
 
 
+@st.fragment
 def page_data_qa():
     """Data QA and session explorer page."""
     st.header("Data Quality & Session Explorer")
@@ -1118,45 +1521,38 @@ def page_data_qa():
         st.info("Load data using the sidebar to begin analysis")
         return
 
+    tel1 = st.session_state.telemetry1
+    tel2 = st.session_state.telemetry2
+    driver1_name = st.session_state.driver1_name
+    driver2_name = st.session_state.driver2_name
+    config = st.session_state.config
+
     # Data availability matrix
     st.subheader("Telemetry Channel Availability Matrix")
 
     # Get all unique channels
-    all_channels = set(st.session_state.telemetry1.columns) | set(
-        st.session_state.telemetry2.columns
-    )
+    all_channels = set(tel1.columns) | set(tel2.columns)
+
+    # Missing percentage per channel, computed for whole frames at once
+    missing1 = tel1.isna().mean() * 100
+    missing2 = tel2.isna().mean() * 100
 
     # Build availability matrix
     availability_data = []
     for channel in sorted(all_channels):
-        driver1_has = channel in st.session_state.telemetry1.columns
-        driver2_has = channel in st.session_state.telemetry2.columns
-
-        # Calculate missing percentage
-        driver1_missing = 0
-        driver2_missing = 0
-
-        if driver1_has:
-            driver1_missing = (
-                st.session_state.telemetry1[channel].isna().sum() / len(st.session_state.telemetry1)
-            ) * 100
+        driver1_has = channel in missing1.index
+        driver2_has = channel in missing2.index
 
-        if driver2_has:
-            driver2_missing = (
-                st.session_state.telemetry2[channel].isna().sum() / len(st.session_state.telemetry2)
-            ) * 100
+        driver1_missing = missing1.get(channel, 0)
+        driver2_missing = missing2.get(channel, 0)
 
         availability_data.append(
             {
                 "Channel": channel,
-                f"{st.session_state.driver1_name} Available": "✓" if driver1_has else "✗",
-                f"{st.session_state.driver1_name} % Missing": f"{driver1_missing:.1f}%"
-                if driver1_has
-                else "N/A",
-                f"{st.session_state.driver2_name} Available": "✓" if driver2_has else "✗",
-                f"{st.session_state.driver2_name} % Missing": f"{driver2_missing:.1f}%"
-                if driver2_has
-                else "N/A",
+                f"{driver1_name} Available": "✓" if driver1_has else "✗",
+                f"{driver1_name} % Missing": f"{driver1_missing:.1f}%" if driver1_has else "N/A",
+                f"{driver2_name} Available": "✓" if driver2_has else "✗",
+                f"{driver2_name} % Missing": f"{driver2_missing:.1f}%" if driver2_has else "N/A",
             }
         )
 
@@ -1169,20 +1565,17 @@ def page_data_qa():
     warnings_found = False
 
     # Check for X/Y position data
-    if (
-        "X" not in st.session_state.telemetry1.columns
-        or "Y" not in st.session_state.telemetry1.columns
-    ):
+    if "X" not in tel1.columns or "Y" not in tel1.columns:
         st.warning("⚠️ No X/Y position data: Track maps and lateral g analysis disabled")
         warnings_found = True
 
     # Check for brake channel
-    if "Brake" not in st.session_state.telemetry1.columns:
+    if "Brake" not in tel1.columns:
         st.warning("⚠️ Brake channel missing: Braking zones analysis disabled")
         warnings_found = True
 
     # Check for gear channel
-    if "nGear" not in st.session_state.telemetry1.columns:
+    if "nGear" not in tel1.columns:
         st.warning("⚠️ Gear channel missing: Gear analysis disabled")
         warnings_found = True
 
@@ -1197,10 +1590,8 @@ def page_data_qa():
         col1, col2 = st.columns(2)
 
         with col1:
-            st.markdown(f"**{st.session_state.driver1_name}**")
-            driver1_all_laps = st.session_state.session.laps.pick_driver(
-                st.session_state.driver1_name
-            )
+            st.markdown(f"**{driver1_name}**")
+            driver1_all_laps = st.session_state.session.laps.pick_driver(driver1_name)
             if not driver1_all_laps.empty:
                 total_laps = len(driver1_all_laps)
                 if "IsAccurate" in driver1_all_laps.columns:
@@ -1214,10 +1605,8 @@ def page_data_qa():
                     st.caption("Validity information not available")
 
         with col2:
-            st.markdown(f"**{st.session_state.driver2_name}**")
-            driver2_all_laps = st.session_state.session.laps.pick_driver(
-                st.session_state.driver2_name
-            )
+            st.markdown(f"**{driver2_name}**")
+            driver2_all_laps = st.session_state.session.laps.pick_driver(driver2_name)
             if not driver2_all_laps.empty:
                 total_laps = len(driver2_all_laps)
                 if "IsAccurate" in driver2_all_laps.columns:
@@ -1234,30 +1623,21 @@ def page_data_qa():
     st.markdown("---")
     st.subheader("Telemetry Data Preview")
 
-    tab1, tab2 = st.tabs([st.session_state.driver1_name, st.session_state.driver2_name])
-
-    with tab1:
-        st.dataframe(st.session_state.telemetry1.head(100), use_container_width=True)
-        st.markdown(f"**Total samples:** {len(st.session_state.telemetry1)}")
-
-    with tab2:
-        st.dataframe(st.session_state.telemetry2.head(100), use_container_width=True)
-        st.markdown(f"**Total samples:** {len(st.session_state.telemetry2)}")
+    _telemetry_preview(tel1, tel2, driver1_name, driver2_name)
 
     # Configuration display
     st.markdown("---")
     st.subheader("Analysis Configuration")
 
-    config_df = pd.DataFrame([st.session_state.config.to_dict()]).T
-    config_df.columns = ["Value"]
-    st.dataframe(config_df, use_container_width=True)
+    # Mixed-type values; shown as JSON rather than a one-column frame Arrow can't type
+    st.json(config.to_dict())
 
     # Cache management
     st.markdown("---")
     st.subheader("Cache Management")
 
     if st.button("Clear FastF1 Cache"):
-        cache_dir = st.session_state.config.cache_dir
+        cache_dir = config.cache_dir
         if cache_dir.exists():
             import shutil
 
@@ -1276,6 +1656,18 @@ def main():
     if params["load_button"]:
         load_data(params)
 
+    # Pages stay usable with the previous data while a load runs in the background
+    if "load_future" in st.session_state:
+        _poll_load()
+
+    load_status = st.session_state.pop("load_status", None)
+    if load_status:
+        status, message = load_status
+        if status == "error":
+            st.error(message)
+        else:
+            st.success(message)
+
     # Page navigation
     page = st.sidebar.radio(
         "Navigation",
@@ -1290,7 +1682,8 @@ def main():
         index=0,
     )
 
-    # Display selected page
+    # Display selected page; pages with their own widgets are fragments, so interacting
+    # with them reruns only the page, not the sidebar
     if page == "Overview":
         page_overview()
     elif page == "Lap Compare":
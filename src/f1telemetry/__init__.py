@@ -10,22 +10,8 @@ License: MIT
 __version__ = "0.3.0"
 __author__ = "João Pedro Cunha"
 
-from f1telemetry import (
-    config,
-    data_loader,
-    alignment,
-    physics,
-    metrics,
-    viz,
-    minisectors,
-    corners,
-    delta_decomp,
-    gg_diagram,
-    multilap,
-    braking_zones,
-    race_pace,
-    style_profile,
-)
+import importlib
+from types import ModuleType
 
 __all__ = [
     "config",
@@ -43,3 +29,10 @@ __all__ = [
     "race_pace",
     "style_profile",
 ]
+
+
+def __getattr__(name: str) -> ModuleType:
+    """Import submodules on first access so importing the package stays cheap."""
+    if name in __all__:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
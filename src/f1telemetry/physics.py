@@ -14,17 +14,35 @@ Note: These are approximate calculations. We ignore:
 
 import logging
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 
 import numpy as np
 import pandas as pd
-from scipy.signal import savgol_filter, find_peaks
+from scipy.ndimage import convolve1d
+from scipy.signal import savgol_coeffs, find_peaks
 
 from f1telemetry.config import Config, DEFAULT_CONFIG
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=8)
+def _savgol_operators(
+    window_length: int, polyorder: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Savitzky-Golay convolution coefficients and edge-fit matrices for one window."""
+    coeffs = savgol_coeffs(window_length, polyorder)
+
+    # Least-squares polynomial fit over one window, as a linear map from samples to fitted
+    # values; the leading/trailing rows reproduce savgol_filter's 'interp' edge handling
+    vander = np.vander(np.arange(window_length, dtype=float), polyorder + 1)
+    projection = vander @ np.linalg.pinv(vander)
+    half = window_length // 2
+
+    return coeffs, projection[:half], projection[window_length - half :]
+
+
 def smooth_signal(
     signal: np.ndarray,
     window_length: int = 11,
@@ -50,7 +68,23 @@ def smooth_signal(
         window_length += 1
 
     try:
-        return savgol_filter(signal, window_length, polyorder)
+        # Equivalent to savgol_filter(signal, window_length, polyorder), with the filter
+        # coefficients and edge fits computed once per window instead of on every call
+        coeffs, head, tail = _savgol_operators(window_length, polyorder)
+
+        values = np.asarray(signal)
+        if values.dtype != np.float64 and values.dtype != np.float32:
+            values = values.astype(np.float64)
+
+        head_window = values[:window_length]
+        tail_window = values[-window_length:]
+        if not (np.isfinite(head_window).all() and np.isfinite(tail_window).all()):
+            raise ValueError("edge windows must not contain infs or NaNs")
+
+        smoothed = convolve1d(values, coeffs, mode="constant")
+        smoothed[: len(head)] = head @ head_window
+        smoothed[len(smoothed) - len(tail) :] = tail @ tail_window
+        return smoothed
     except Exception as e:
         logger.warning(f"Smoothing failed: {e}, returning original signal")
         return signal
@@ -184,18 +184,17 @@ def filter_valid_laps(
 
     # Exclude outliers
     if exclude_outliers and not filtered.empty:
-        lap_times = []
-        for lt in filtered["LapTime"]:
-            if hasattr(lt, "total_seconds"):
-                lap_times.append(lt.total_seconds())
-            else:
-                lap_times.append(float(lt))
-
-        median_time = np.median(lap_times)
+        lap_times = filtered["LapTime"]
+        if pd.api.types.is_numeric_dtype(lap_times):
+            lap_seconds = lap_times.to_numpy(dtype=float)
+        else:
+            lap_seconds = pd.to_timedelta(lap_times).dt.total_seconds().to_numpy()
+
+        median_time = np.median(lap_seconds)
         threshold_time = median_time * outlier_threshold
 
-        filtered["LapTimeSeconds"] = lap_times
-        filtered = filtered[filtered["LapTimeSeconds"] < threshold_time]
+        filtered["LapTimeSeconds"] = lap_seconds
+        filtered = filtered[lap_seconds < threshold_time]
 
     return filtered
 
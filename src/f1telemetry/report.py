@@ -9,7 +9,7 @@ Author: João Pedro Cunha
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 import pandas as pd
 from jinja2 import Template
@@ -277,7 +277,7 @@ HTML_TEMPLATE = """
 """
 
 
-def generate_html_report(
+def _build_report_context(
     session_info: dict,
     comparison_summary: dict,
     driver1_name: str,
@@ -289,35 +289,16 @@ def generate_html_report(
     corners1: Optional[list] = None,
     corners2: Optional[list] = None,
     decompositions: Optional[list] = None,
-    output_path: Optional[Path] = None,
-    # Legacy parameters for backward compatibility
-    lap1: object = None,
-    lap2: object = None,
-) -> str:
+) -> dict:
     """
-    Generate HTML report for lap comparison.
+    Build the template context (insights and plot HTML) for the report.
 
     Args:
-        session_info: Session metadata dictionary
-        comparison_summary: Comparison summary from metrics
-        driver1_name: Name/code for driver 1
-        driver2_name: Name/code for driver 2
-        telemetry1: Aligned telemetry for driver 1 (with physics channels)
-        telemetry2: Aligned telemetry for driver 2 (with physics channels)
-        config: Configuration
-        minisector_data: Optional minisector comparison data
-        corners1: Optional corner data for driver 1
-        corners2: Optional corner data for driver 2
-        decompositions: Optional corner decompositions
-        output_path: Optional path to save report
-        lap1: Legacy parameter (deprecated)
-        lap2: Legacy parameter (deprecated)
+        See generate_html_report.
 
     Returns:
-        HTML report string
+        Dictionary of template variables
     """
-    logger.info("Generating HTML report...")
-
     # Generate enhanced insights if components are available
     enhanced_insights = None
     if INSIGHTS_AVAILABLE and minisector_data is not None:
@@ -371,24 +352,82 @@ def generate_html_report(
         telemetry1, telemetry2, driver1_name, driver2_name, "Speed", config
     ).to_html(include_plotlyjs=False, div_id="track_map_plot")
 
+    return {
+        "session_info": session_info,
+        "driver1_name": driver1_name,
+        "driver2_name": driver2_name,
+        "final_delta": comparison_summary["final_delta"],
+        "insights": comparison_summary.get("insights", []),
+        "enhanced_insights": enhanced_insights,
+        "plot_speed": plot_speed,
+        "plot_delta": plot_delta,
+        "plot_segments": plot_segments,
+        "plot_throttle_brake": plot_throttle_brake,
+        "plot_gear": plot_gear,
+        "plot_acceleration": plot_acceleration,
+        "plot_track_map": plot_track_map,
+        "generation_time": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+    }
+
+
+def generate_html_report(
+    session_info: dict,
+    comparison_summary: dict,
+    driver1_name: str,
+    driver2_name: str,
+    telemetry1: pd.DataFrame,
+    telemetry2: pd.DataFrame,
+    config: Config = DEFAULT_CONFIG,
+    minisector_data: Optional[pd.DataFrame] = None,
+    corners1: Optional[list] = None,
+    corners2: Optional[list] = None,
+    decompositions: Optional[list] = None,
+    output_path: Optional[Path] = None,
+    # Legacy parameters for backward compatibility
+    lap1: object = None,
+    lap2: object = None,
+) -> str:
+    """
+    Generate HTML report for lap comparison.
+
+    Args:
+        session_info: Session metadata dictionary
+        comparison_summary: Comparison summary from metrics
+        driver1_name: Name/code for driver 1
+        driver2_name: Name/code for driver 2
+        telemetry1: Aligned telemetry for driver 1 (with physics channels)
+        telemetry2: Aligned telemetry for driver 2 (with physics channels)
+        config: Configuration
+        minisector_data: Optional minisector comparison data
+        corners1: Optional corner data for driver 1
+        corners2: Optional corner data for driver 2
+        decompositions: Optional corner decompositions
+        output_path: Optional path to save report
+        lap1: Legacy parameter (deprecated)
+        lap2: Legacy parameter (deprecated)
+
+    Returns:
+        HTML report string
+    """
+    logger.info("Generating HTML report...")
+
+    context = _build_report_context(
+        session_info,
+        comparison_summary,
+        driver1_name,
+        driver2_name,
+        telemetry1,
+        telemetry2,
+        config,
+        minisector_data,
+        corners1,
+        corners2,
+        decompositions,
+    )
+
     # Render template
     template = Template(HTML_TEMPLATE)
-    html_content = template.render(
-        session_info=session_info,
-        driver1_name=driver1_name,
-        driver2_name=driver2_name,
-        final_delta=comparison_summary["final_delta"],
-        insights=comparison_summary.get("insights", []),
-        enhanced_insights=enhanced_insights,
-        plot_speed=plot_speed,
-        plot_delta=plot_delta,
-        plot_segments=plot_segments,
-        plot_throttle_brake=plot_throttle_brake,
-        plot_gear=plot_gear,
-        plot_acceleration=plot_acceleration,
-        plot_track_map=plot_track_map,
-        generation_time=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-    )
+    html_content = template.render(**context)
 
     # Save if output path provided
     if output_path:
@@ -400,6 +439,48 @@ def generate_html_report(
     return html_content
 
 
+def stream_html_report(
+    session_info: dict,
+    comparison_summary: dict,
+    driver1_name: str,
+    driver2_name: str,
+    telemetry1: pd.DataFrame,
+    telemetry2: pd.DataFrame,
+    config: Config = DEFAULT_CONFIG,
+    minisector_data: Optional[pd.DataFrame] = None,
+    corners1: Optional[list] = None,
+    corners2: Optional[list] = None,
+    decompositions: Optional[list] = None,
+) -> Iterator[bytes]:
+    """
+    Render the HTML report incrementally as UTF-8 encoded chunks.
+
+    Uses Jinja's template streaming so the full document is never held as a
+    single string. Takes the same arguments as generate_html_report.
+
+    Yields:
+        Encoded chunks of the HTML report
+    """
+    logger.info("Streaming HTML report...")
+
+    context = _build_report_context(
+        session_info,
+        comparison_summary,
+        driver1_name,
+        driver2_name,
+        telemetry1,
+        telemetry2,
+        config,
+        minisector_data,
+        corners1,
+        corners2,
+        decompositions,
+    )
+
+    for chunk in Template(HTML_TEMPLATE).stream(**context):
+        yield chunk.encode("utf-8")
+
+
 def save_plots_as_images(
     telemetry1: pd.DataFrame,
     telemetry2: pd.DataFrame,
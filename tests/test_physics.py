@@ -71,6 +71,22 @@ class TestSmoothSignal:
 
         np.testing.assert_array_equal(signal, smoothed)
 
+    def test_failed_smoothing_returns_original(self):
+        """Test the input itself is returned when the edges cannot be fitted."""
+        signal = pd.Series([np.nan] + [1.0] * 30)
+        smoothed = smooth_signal(signal, window_length=11)
+
+        assert smoothed is signal
+
+    def test_matches_savgol_filter(self):
+        """Test smoothing matches scipy's savgol_filter, including the edges."""
+        from scipy.signal import savgol_filter
+
+        signal = np.random.default_rng(0).standard_normal(200) * 50
+        smoothed = smooth_signal(signal, window_length=11, polyorder=3)
+
+        np.testing.assert_allclose(smoothed, savgol_filter(signal, 11, 3), atol=1e-9)
+
 
 class TestComputeAcceleration:
     """Tests for acceleration computation."""
@@ -0,0 +1,51 @@
+"""
+Tests for the Streamlit app's cached pipeline stages.
+
+Author: João Pedro Cunha
+"""
+
+import importlib.util
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+from fastf1.core import Telemetry
+
+APP_PATH = Path(__file__).parent.parent / "app" / "streamlit_app.py"
+
+
+@pytest.fixture(scope="module")
+def app_module():
+    """Import the dashboard script as a module (no page is rendered)."""
+    spec = importlib.util.spec_from_file_location("streamlit_app", APP_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def create_mock_lap(shift: float = 0.0) -> Telemetry:
+    """Create raw lap telemetry as FastF1 returns it (a Telemetry DataFrame subclass)."""
+    distance = np.linspace(0, 1000, 200)
+    speed = 200 + 50 * np.sin(distance / 100 + shift)
+
+    return Telemetry(
+        {
+            "Distance": distance,
+            "Speed": speed,
+            "Throttle": np.clip(speed - 150, 0, 100),
+            "Brake": np.where(np.gradient(speed) < 0, 100, 0),
+        }
+    )
+
+
+class TestAlignWithPhysics:
+    """Tests for the cached alignment and physics stage."""
+
+    def test_accepts_fastf1_telemetry(self, app_module):
+        """Test FastF1 Telemetry laps can be aligned through the cache."""
+        tel1, tel2 = app_module._align_with_physics(create_mock_lap(), create_mock_lap(0.1), 1.0)
+
+        assert isinstance(tel1, pd.DataFrame)
+        assert "Acceleration" in tel1.columns
+        assert len(tel1) == len(tel2)